@@ -0,0 +1,20 @@
+"""
+No-op stand-in for the Unix-only 'resource' module on Windows.
+
+swebench imports 'resource' at module load, which raises ModuleNotFoundError
+on Windows. Importing this module first registers a tiny real module with
+the constants and functions swebench uses, so attribute access stays a plain
+module lookup.
+"""
+
+import sys
+import types
+
+if sys.platform == "win32" and "resource" not in sys.modules:
+    resource = types.ModuleType("resource")
+    resource.RLIMIT_AS = 9
+    resource.RLIMIT_CPU = 0
+    resource.RLIM_INFINITY = -1
+    resource.setrlimit = lambda *_args, **_kwargs: None
+    resource.getrlimit = lambda *_args, **_kwargs: (-1, -1)
+    sys.modules["resource"] = resource
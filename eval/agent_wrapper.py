@@ -1,5 +1,6 @@
 import asyncio
 import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -18,9 +19,53 @@ except ImportError:
     sys.exit(1)
 
 
+# Prompt sent to the agent for every task. Built once; only the workspace path
+# and the problem statement change between tasks.
+FOCUSED_TASK_TEMPLATE = """You are a code repair agent. Your ONLY job is to fix the bug described below.
+
+WORKSPACE INFORMATION:
+- Current working directory: {repo_path}
+- All file paths should be RELATIVE to this directory
+- Example: Use "astropy/modeling/separable.py" NOT absolute paths
+
+CRITICAL INSTRUCTIONS:
+1. Read the relevant files mentioned in the problem using RELATIVE paths
+2. Identify the exact bug location
+3. Generate the minimal fix using edit_file with RELATIVE paths
+4. Do NOT write summaries, documentation, or explanations
+5. Do NOT create test files unless explicitly required
+6. FOCUS on generating the patch that fixes the issue
+7. Maximum 8 tool calls total - be efficient!
+
+PROBLEM TO SOLVE:
+{problem_statement}
+
+START NOW: Use list_dir to explore, read_file to find the bug, edit_file to fix it, etc etc."""
+
+
+def _format_message_debug(index, msg):
+    """Format one team message for the debug dump without stringifying large contents."""
+    content = getattr(msg, "content", "")
+    if isinstance(content, str):
+        length = f"{len(content)} chars"
+        preview = content[:200]
+    else:
+        # Tool calls/results: only the preview is worth rendering
+        length = "n/a"
+        preview = repr(content)[:200]
+    return (
+        f"[DEBUG] Message {index}:\n"
+        f"  - Source: {getattr(msg, 'source', 'Unknown')}\n"
+        f"  - Type: {type(msg).__name__}\n"
+        f"  - Content length: {length}\n"
+        f"  - Content preview: {preview}"
+    )
+
+
 class SWESolver:
     def __init__(self, model_override=None):
-        # Initialize in headless mode (no interactive CLI) for evaluation
+        # Initialize in headless mode (no interactive CLI) for evaluation.
+        # Per-problem state is reset in solve(), so one solver serves every task.
         self.app = DaveAgentCLI(debug=False, model=model_override, headless=True)
         # Ensure we are in agent mode
         self.app.current_mode = "agent"
@@ -31,6 +76,9 @@ class SWESolver:
 
     async def solve(self, problem_statement, repo_path):
         current_dir = os.getcwd()
+        # Resolve once: the file tools resolve relative paths against the CWD,
+        # so we still chdir, but git and cleanup use this explicit path.
+        repo_path = Path(repo_path).resolve()
         try:
             print("\n[DEBUG] Starting solve()")
             print(f"[DEBUG] Current dir: {current_dir}")
@@ -39,16 +87,10 @@ class SWESolver:
             os.chdir(repo_path)
             print(f"[DEBUG] Changed to: {os.getcwd()}")
 
-            # FORCE CLEAN MEMORY
-            daveagent_dir = Path(".daveagent")
-            if daveagent_dir.exists():
-                import shutil
-
-                print(f"[DEBUG] Cleaning previous memory at {daveagent_dir}...")
-                try:
-                    shutil.rmtree(daveagent_dir)
-                except Exception as e:
-                    print(f"[WARNING] Failed to clean .daveagent: {e}")
+            # FORCE CLEAN MEMORY (off the event loop; a missing dir is fine)
+            daveagent_dir = repo_path / ".daveagent"
+            print(f"[DEBUG] Cleaning previous memory at {daveagent_dir}...")
+            await asyncio.to_thread(shutil.rmtree, daveagent_dir, ignore_errors=True)
 
             # Reset agent state (memory, tools) for the new context
             print("[DEBUG] Updating agent tools for mode...")
@@ -64,27 +106,9 @@ class SWESolver:
 
             # Create focused task with explicit instructions
             # Include current working directory so agent knows where to look
-            abs_repo_path = os.path.abspath(repo_path)
-            focused_task = f"""You are a code repair agent. Your ONLY job is to fix the bug described below.
-
-WORKSPACE INFORMATION:
-- Current working directory: {abs_repo_path}
-- All file paths should be RELATIVE to this directory
-- Example: Use "astropy/modeling/separable.py" NOT absolute paths
-
-CRITICAL INSTRUCTIONS:
-1. Read the relevant files mentioned in the problem using RELATIVE paths
-2. Identify the exact bug location
-3. Generate the minimal fix using edit_file with RELATIVE paths
-4. Do NOT write summaries, documentation, or explanations
-5. Do NOT create test files unless explicitly required
-6. FOCUS on generating the patch that fixes the issue
-7. Maximum 8 tool calls total - be efficient!
-
-PROBLEM TO SOLVE:
-{problem_statement}
-
-START NOW: Use list_dir to explore, read_file to find the bug, edit_file to fix it, etc etc."""
+            focused_task = FOCUSED_TASK_TEMPLATE.format(
+                repo_path=repo_path, problem_statement=problem_statement
+            )
 
             print(f"Solving problem: {problem_statement[:100]}...")
             print("\n" + "=" * 50)
@@ -118,31 +142,35 @@ START NOW: Use list_dir to explore, read_file to find the bug, edit_file to fix
                 print("\n[EVAL] Agent completed conversation")
                 print(f"[EVAL] Total messages exchanged: {len(result.messages)}")
 
-                # Print each message for debugging
-                print("\n[DEBUG] ===== MESSAGE DETAILS =====")
-                for i, msg in enumerate(result.messages):
-                    source = getattr(msg, "source", "Unknown")
-                    content = getattr(msg, "content", "")
-                    msg_type = type(msg).__name__
-
-                    print(f"[DEBUG] Message {i + 1}:")
-                    print(f"  - Source: {source}")
-                    print(f"  - Type: {msg_type}")
-                    print(f"  - Content length: {len(str(content))} chars")
-                    print(f"  - Content preview: {str(content)[:200]}")
-                print("[DEBUG] ===== END MESSAGE DETAILS =====\n")
+                # Print each message for debugging (one write for the whole block)
+                print(
+                    "\n[DEBUG] ===== MESSAGE DETAILS =====\n"
+                    + "\n".join(
+                        _format_message_debug(i, msg) for i, msg in enumerate(result.messages, 1)
+                    )
+                    + "\n[DEBUG] ===== END MESSAGE DETAILS =====\n"
+                )
 
                 print(f"[SUCCESS] Agent finished. Total messages: {len(result.messages)}")
 
-                # CHECK FOR CHANGES
-                import subprocess
-
-                diff_check = subprocess.run(["git", "diff"], capture_output=True, text=True).stdout
+                # CHECK FOR CHANGES (non-blocking; --exit-code answers "changed?"
+                # without transferring the full patch, which the caller fetches)
+                proc = await asyncio.create_subprocess_exec(
+                    "git",
+                    "-C",
+                    str(repo_path),
+                    "diff",
+                    "--stat",
+                    "--exit-code",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                diff_stat, _ = await proc.communicate()
 
-                if not diff_check.strip():
+                if proc.returncode == 0:
                     print("[WARNING] No changes detected. Skipping retry to save time.")
                 else:
-                    print(f"[SUCCESS] Patch generated ({len(diff_check)} characters)")
+                    print(f"[SUCCESS] Patch generated:\n{diff_stat.decode(errors='replace')}")
 
             except TimeoutError:
                 print("[TIMEOUT] Task exceeded 20 minutes. Moving to next task.")
@@ -6,40 +6,180 @@ análisis de qué herramientas usó, qué archivos leyó, qué errores tuvo, etc
 """
 
 import json
+import mmap
+import os
+import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from html import escape as _esc
 from pathlib import Path
 
+# Cada cuántos archivos se imprime el progreso del análisis
+PROGRESS_EVERY = 50
+
+# orjson es opcional: parsea bytes directamente y es bastante más rápido
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+# A partir de este tamaño los logs se leen con mmap en lugar de línea a línea
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Versión del formato de la caché de análisis; subirla invalida las cachés viejas
+_CACHE_VERSION = 1
+
 
 def find_json_logs(base_dir):
     """Busca todos los archivos JSON de logging del agent"""
     json_files = []
 
     # Buscar en .daveagent/logs/ o en el directorio base
-    log_dirs = [Path(base_dir) / ".daveagent" / "logs", Path(base_dir) / "logs", Path(base_dir)]
+    log_dirs = [
+        os.path.join(base_dir, ".daveagent", "logs"),
+        os.path.join(base_dir, "logs"),
+        os.fspath(base_dir),
+    ]
 
     for log_dir in log_dirs:
-        if log_dir.exists():
-            json_files.extend(log_dir.glob("*.json"))
+        # scandir es más rápido que Path.glob y su error sustituye al exists()
+        try:
+            with os.scandir(log_dir) as entries:
+                json_files.extend(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            continue
 
     return json_files
 
 
+# Herramienta -> lista de archivos del análisis que alimenta
+_TOOL_TARGETS = {
+    "read_file": "files_read",
+    "write_file": "files_written",
+    "edit_file": "files_edited",
+}
+
+
+def _parse_json_args(args):
+    """Decodifica argumentos de herramienta serializados como JSON"""
+    try:
+        return _loads(args)
+    except (ValueError, TypeError):
+        return {}
+
+
+def _handle_thought(log, analysis):
+    """Cuenta un evento de pensamiento"""
+    analysis["thinking_events"] += 1
+
+
+def _handle_tool_call(log, analysis):
+    """Registra una llamada a herramienta y los archivos que toca"""
+    analysis["tool_calls"] += 1
+    # Extract tool names
+    content = log.get("content", {})
+    if not isinstance(content, dict):
+        return
+    tool_name = content.get("name", "")
+    if not tool_name:
+        return
+    analysis["tools_used"].append(sys.intern(tool_name))
+
+    # Extract file operations (a log can mix JSON-string and dict arguments)
+    args = content.get("arguments", {})
+    if isinstance(args, str):
+        args = _parse_json_args(args)
+
+    key = _TOOL_TARGETS.get(tool_name)
+    if key is not None:
+        file_path = args.get("target_file", "")
+        if file_path:
+            analysis[key].append(file_path)
+
+
+def _handle_tool_execution(log, analysis):
+    """Registra el error de una ejecución de herramienta, si lo hubo"""
+    content = log.get("content", {})
+    if isinstance(content, dict) and content.get("is_error", False):
+        analysis["errors"].append(content.get("content", ""))
+
+
+# Tipo de evento -> handler; evita la cadena de if/elif por cada línea
+_DISPATCH = {
+    "ThoughtEvent": _handle_thought,
+    "ToolCallRequestEvent": _handle_tool_call,
+    "ToolCallExecutionEvent": _handle_tool_execution,
+}
+
+
 def analyze_log_file(log_path):
-    """Analiza un archivo de log JSON del agent"""
+    """Analiza un archivo de log JSON del agent, reutilizando la caché si sigue vigente"""
+    log_path = Path(log_path)
     try:
-        with open(log_path, encoding="utf-8") as f:
-            logs = [json.loads(line) for line in f if line.strip()]
-    except Exception as e:
+        st = log_path.stat()
+    except OSError as e:
         print(f"   Warning: Could not read {log_path}: {e}")
         return None
+    cache_key = f"{_CACHE_VERSION}-{st.st_mtime_ns}-{st.st_size}"
+    cache_path = log_path.with_name(log_path.name + ".cache")
+
+    try:
+        cached = _loads(cache_path.read_bytes())
+        if cached.get("_key") == cache_key:
+            analysis = cached["analysis"]
+            analysis["tools_used"] = Counter(analysis["tools_used"])
+            return analysis
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    analysis = _analyze_log(log_path)
+    if analysis is not None:
+        try:
+            cache_path.write_bytes(_dumps({"_key": cache_key, "analysis": analysis}))
+        except OSError as e:
+            print(f"   Warning: Could not write cache {cache_path}: {e}")
+    return analysis
+
 
+def _iter_lines(f):
+    """Itera las líneas (bytes) de un log; los archivos grandes se recorren con mmap"""
+    if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+        yield from f
+        return
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while True:
+            nl = mm.find(b"\n", start)
+            if nl == -1:
+                if start < len(mm):
+                    yield mm[start:]
+                return
+            yield mm[start:nl]
+            start = nl + 1
+
+
+def _analyze_log(log_path):
+    """Recorre el log línea a línea y calcula el análisis"""
     analysis = {
-        "total_messages": len(logs),
-        "tools_used": Counter(),
-        "files_read": set(),
-        "files_written": set(),
-        "files_edited": set(),
+        "total_messages": 0,
+        # Se acumulan en listas y se agregan una sola vez al final
+        "tools_used": [],
+        "files_read": [],
+        "files_written": [],
+        "files_edited": [],
         "errors": [],
         "thinking_events": 0,
         "tool_calls": 0,
@@ -50,158 +190,114 @@ def analyze_log_file(log_path):
     start_time = None
     end_time = None
 
-    for log in logs:
-        # Extract timestamp
-        if "timestamp" in log:
-            ts = datetime.fromisoformat(log["timestamp"])
-            if start_time is None:
-                start_time = ts
-            end_time = ts
-
-        # Extract model info
-        if "model" in log and analysis["model_used"] is None:
-            analysis["model_used"] = log["model"]
-
-        # Analyze message type
-        msg_type = log.get("type", "")
-
-        if msg_type == "ThoughtEvent":
-            analysis["thinking_events"] += 1
-
-        elif msg_type == "ToolCallRequestEvent":
-            analysis["tool_calls"] += 1
-            # Extract tool names
-            content = log.get("content", {})
-            if isinstance(content, dict):
-                tool_name = content.get("name", "")
-                if tool_name:
-                    analysis["tools_used"][tool_name] += 1
-
-                    # Extract file operations
-                    args = content.get("arguments", {})
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except:
-                            args = {}
-
-                    if tool_name == "read_file":
-                        file_path = args.get("target_file", "")
-                        if file_path:
-                            analysis["files_read"].add(file_path)
-
-                    elif tool_name == "write_file":
-                        file_path = args.get("target_file", "")
-                        if file_path:
-                            analysis["files_written"].add(file_path)
-
-                    elif tool_name == "edit_file":
-                        file_path = args.get("target_file", "")
-                        if file_path:
-                            analysis["files_edited"].add(file_path)
-
-        elif msg_type == "ToolCallExecutionEvent":
-            # Check for errors
-            content = log.get("content", {})
-            if isinstance(content, dict):
-                is_error = content.get("is_error", False)
-                if is_error:
-                    error_msg = content.get("content", "")
-                    analysis["errors"].append(error_msg)
+    # Una sola pasada: parsear y analizar cada línea sin guardar la lista completa
+    try:
+        with open(log_path, "rb") as f:
+            for line in _iter_lines(f):
+                # isspace() checks in place, without building a stripped copy
+                if not line or line.isspace():
+                    continue
+                log = _loads(line)
+                analysis["total_messages"] += 1
+
+                # Extract timestamp (kept as string; parsed only once at the end)
+                ts = log.get("timestamp")
+                if ts:
+                    if start_time is None:
+                        start_time = ts
+                    end_time = ts
+
+                # Extract model info
+                if "model" in log and analysis["model_used"] is None:
+                    analysis["model_used"] = log["model"]
+
+                # Analyze message type
+                handler = _DISPATCH.get(log.get("type"))
+                if handler is not None:
+                    handler(log, analysis)
+    except Exception as e:
+        print(f"   Warning: Could not read {log_path}: {e}")
+        return None
 
     # Calculate duration
     if start_time and end_time:
-        analysis["duration_seconds"] = (end_time - start_time).total_seconds()
+        analysis["duration_seconds"] = (
+            datetime.fromisoformat(end_time) - datetime.fromisoformat(start_time)
+        ).total_seconds()
 
-    # Convert sets to lists for JSON serialization
-    analysis["files_read"] = list(analysis["files_read"])
-    analysis["files_written"] = list(analysis["files_written"])
-    analysis["files_edited"] = list(analysis["files_edited"])
+    # Count tools in one go; dedupe and sort files once so the report can use
+    # them as-is (lists keep it JSON serializable)
+    analysis["tools_used"] = Counter(analysis["tools_used"])
+    analysis["files_read"] = sorted(set(analysis["files_read"]))
+    analysis["files_written"] = sorted(set(analysis["files_written"]))
+    analysis["files_edited"] = sorted(set(analysis["files_edited"]))
 
     return analysis
 
 
-def generate_interaction_report(analyses, output_path):
-    """Genera un reporte HTML de las interacciones del agent"""
-
-    total_tasks = len(analyses)
-
-    # Agregar estadísticas globales
-    all_tools = Counter()
-    total_messages = 0
-    total_tool_calls = 0
-    total_thinking = 0
-    total_errors = 0
-
-    for analysis in analyses.values():
-        if analysis:
-            all_tools.update(analysis["tools_used"])
-            total_messages += analysis["total_messages"]
-            total_tool_calls += analysis["tool_calls"]
-            total_thinking += analysis["thinking_events"]
-            total_errors += len(analysis["errors"])
-
-    html = f"""<!DOCTYPE html>
+# Parte estática del reporte (sin interpolación), codificada una sola vez
+_HTML_HEAD = b"""<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Análisis de Interacciones del agent - {datetime.now().strftime("%Y-%m-%d %H:%M")}</title>
-    <style>
-        body {{
+"""
+
+_HTML_STYLE = b"""    <style>
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .summary {{
+        }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .summary-card {{
+        }
+        .summary-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary-number {{
+        }
+        .summary-number {
             font-size: 32px;
             font-weight: bold;
             color: #f5576c;
-        }}
-        .summary-label {{
+        }
+        .summary-label {
             color: #666;
             font-size: 14px;
             margin-top: 5px;
-        }}
-        .chart-container {{
+        }
+        .chart-container {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 30px;
-        }}
-        .tool-bar {{
+        }
+        .tool-bar {
             display: flex;
             align-items: center;
             margin: 10px 0;
-        }}
-        .tool-name {{
+        }
+        .tool-name {
             width: 150px;
             font-weight: 500;
-        }}
-        .tool-bar-fill {{
+        }
+        .tool-bar-fill {
             height: 30px;
             background: linear-gradient(90deg, #f093fb 0%, #f5576c 100%);
             border-radius: 5px;
@@ -210,75 +306,150 @@ def generate_interaction_report(analyses, output_path):
             padding: 0 10px;
             color: white;
             font-weight: bold;
-        }}
-        .task-details {{
+        }
+        .task-details {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
-        .task-header {{
+        }
+        .task-header {
             font-size: 18px;
             font-weight: bold;
             color: #333;
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 2px solid #f0f0f0;
-        }}
-        .metric-row {{
+        }
+        .metric-row {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin: 15px 0;
-        }}
-        .metric {{
+        }
+        .metric {
             padding: 10px;
             background: #f8f9fa;
             border-radius: 5px;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             font-size: 12px;
             color: #666;
             text-transform: uppercase;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 20px;
             font-weight: bold;
             color: #333;
             margin-top: 5px;
-        }}
-        .file-list {{
+        }
+        .file-list {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             margin: 10px 0;
             max-height: 200px;
             overflow-y: auto;
-        }}
-        .file-item {{
+        }
+        .file-item {
             padding: 5px 0;
             font-family: 'Courier New', monospace;
             font-size: 13px;
-        }}
-        .error-box {{
+        }
+        .error-box {
             background: #f8d7da;
             border-left: 4px solid #dc3545;
             padding: 15px;
             margin: 10px 0;
             border-radius: 5px;
-        }}
-        .error-text {{
+        }
+        .error-text {
             color: #721c24;
             font-family: 'Courier New', monospace;
             font-size: 13px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+# Bloques repetidos por tarea del reporte HTML, construidos una sola vez
+_TASK_TEMPLATE = """
+    <div class="task-details">
+        <div class="task-header">{task_id}</div>
+
+        <div class="metric-row">
+            <div class="metric">
+                <div class="metric-label">Mensajes Totales</div>
+                <div class="metric-value">{total_messages}</div>
+            </div>
+            <div class="metric">
+                <div class="metric-label">Llamadas a Herramientas</div>
+                <div class="metric-value">{tool_calls}</div>
+            </div>
+            <div class="metric">
+                <div class="metric-label">Eventos de Pensamiento</div>
+                <div class="metric-value">{thinking_events}</div>
+            </div>
+            <div class="metric">
+                <div class="metric-label">Duración</div>
+                <div class="metric-value">{duration_seconds:.1f}s</div>
+            </div>
+        </div>
+"""
+
+_FILE_SECTION_TEMPLATE = """
+        <h4>{title} ({count})</h4>
+        <div class="file-list">
+{items}
+        </div>
+"""
+
+_FILE_SECTIONS = (
+    ("files_read", "📖 Archivos Leídos"),
+    ("files_edited", "✏️ Archivos Editados"),
+    ("files_written", "📝 Archivos Escritos"),
+)
+
+_ERROR_TEMPLATE = """
+        <div class="error-box">
+            <div class="error-text">{error}</div>
+        </div>
+"""
+
+
+def generate_interaction_report(analyses, output_path):
+    """Genera un reporte HTML de las interacciones del agent"""
+
+    total_tasks = len(analyses)
+
+    # Agregar estadísticas globales
+    all_tools = Counter()
+    total_messages = 0
+    total_tool_calls = 0
+    total_thinking = 0
+    total_errors = 0
+
+    for analysis in analyses.values():
+        if analysis:
+            all_tools.update(analysis["tools_used"])
+            total_messages += analysis["total_messages"]
+            total_tool_calls += analysis["tool_calls"]
+            total_thinking += analysis["thinking_events"]
+            total_errors += len(analysis["errors"])
+
+    # Se acumulan fragmentos y se unen una sola vez (evita el += cuadrático)
+    parts = []
+    now = datetime.now()
+    parts.append(_HTML_HEAD)
+    parts.append(
+        f"    <title>Análisis de Interacciones del agent - {now.strftime('%Y-%m-%d %H:%M')}</title>\n"
+    )
+    parts.append(_HTML_STYLE)
+    parts.append(f"""    <div class="header">
         <h1>🔍 Análisis de Interacciones del agent</h1>
-        <p>Reporte generado: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+        <p>Reporte generado: {now.strftime("%Y-%m-%d %H:%M:%S")}</p>
     </div>
 
     <div class="summary">
@@ -310,116 +481,74 @@ def generate_interaction_report(analyses, output_path):
 
     <div class="chart-container">
         <h2>📊 Herramientas Más Utilizadas</h2>
-"""
+""")
 
     # Top 10 herramientas
     max_count = max(all_tools.values()) if all_tools else 1
     for tool, count in all_tools.most_common(10):
         width = (count / max_count) * 100
-        html += f"""
+        parts.append(f"""
         <div class="tool-bar">
             <div class="tool-name">{tool}</div>
             <div class="tool-bar-fill" style="width: {width}%;">
                 {count}
             </div>
         </div>
-"""
+""")
 
-    html += """
+    parts.append("""
     </div>
 
     <h2 style="margin-top: 30px; margin-bottom: 20px;">📝 Detalle por Tarea</h2>
-"""
+""")
 
     # Detalles de cada tarea
-    for task_id, analysis in sorted(analyses.items()):
+    # Ordenar solo las claves: los ids son únicos y nunca se comparan los dicts
+    for task_id in sorted(analyses):
+        analysis = analyses[task_id]
         if not analysis:
             continue
 
-        html += f"""
-    <div class="task-details">
-        <div class="task-header">{task_id}</div>
-
-        <div class="metric-row">
-            <div class="metric">
-                <div class="metric-label">Mensajes Totales</div>
-                <div class="metric-value">{analysis["total_messages"]}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Llamadas a Herramientas</div>
-                <div class="metric-value">{analysis["tool_calls"]}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Eventos de Pensamiento</div>
-                <div class="metric-value">{analysis["thinking_events"]}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Duración</div>
-                <div class="metric-value">{analysis["duration_seconds"]:.1f}s</div>
-            </div>
-        </div>
-"""
-
-        # Archivos leídos
-        if analysis["files_read"]:
-            html += f"""
-        <h4>📖 Archivos Leídos ({len(analysis["files_read"])})</h4>
-        <div class="file-list">
-"""
-            for file in sorted(analysis["files_read"]):
-                html += f'            <div class="file-item">{file}</div>\n'
-            html += """
-        </div>
-"""
-
-        # Archivos editados
-        if analysis["files_edited"]:
-            html += f"""
-        <h4>✏️ Archivos Editados ({len(analysis["files_edited"])})</h4>
-        <div class="file-list">
-"""
-            for file in sorted(analysis["files_edited"]):
-                html += f'            <div class="file-item">{file}</div>\n'
-            html += """
-        </div>
-"""
-
-        # Archivos escritos
-        if analysis["files_written"]:
-            html += f"""
-        <h4>📝 Archivos Escritos ({len(analysis["files_written"])})</h4>
-        <div class="file-list">
-"""
-            for file in sorted(analysis["files_written"]):
-                html += f'            <div class="file-item">{file}</div>\n'
-            html += """
-        </div>
-"""
+        parts.append(_TASK_TEMPLATE.format_map({**analysis, "task_id": _esc(task_id)}))
+
+        # Archivos leídos / editados / escritos
+        for key, title in _FILE_SECTIONS:
+            files = analysis[key]
+            if files:
+                parts.append(
+                    _FILE_SECTION_TEMPLATE.format(
+                        title=title,
+                        count=len(files),
+                        items="".join(
+                            f'            <div class="file-item">{_esc(file)}</div>\n'
+                            for file in files
+                        ),
+                    )
+                )
 
         # Errores
         if analysis["errors"]:
-            html += f"""
+            parts.append(f"""
         <h4>⚠️ Errores ({len(analysis["errors"])})</h4>
-"""
-            for error in analysis["errors"]:
-                error_escaped = error.replace("<", "&lt;").replace(">", "&gt;")
-                html += f"""
-        <div class="error-box">
-            <div class="error-text">{error_escaped}</div>
-        </div>
-"""
+""")
+            parts.extend(
+                _ERROR_TEMPLATE.format(error=_esc(error, quote=False))
+                for error in analysis["errors"]
+            )
 
-        html += """
+        parts.append("""
     </div>
-"""
+""")
 
-    html += """
+    parts.append("""
 </body>
 </html>
-"""
+""")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Escribir los fragmentos ya codificados con un buffer grande, sin unirlos
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        for part in parts:
+            f.write(part if isinstance(part, bytes) else part.encode("utf-8"))
 
     print(f"✓ Reporte de interacciones generado: {output_path}")
 
@@ -447,14 +576,20 @@ def main():
     print("📊 Analizando logs...")
     analyses = {}
 
-    for log_file in log_files:
-        # Intentar extraer el instance_id del nombre del archivo
-        instance_id = log_file.stem
-        print(f"   - Analizando {instance_id}...")
+    # Intentar extraer el instance_id del nombre del archivo
+    instance_ids = [log_file.stem for log_file in log_files]
+    total = len(log_files)
 
-        analysis = analyze_log_file(log_file)
-        if analysis:
-            analyses[instance_id] = analysis
+    # Cada archivo es independiente: se analizan en paralelo en varios procesos
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(analyze_log_file, log_files, chunksize=4)
+        for done, (instance_id, analysis) in enumerate(zip(instance_ids, results, strict=True), 1):
+            if analysis:
+                analyses[instance_id] = analysis
+
+            # Progreso cada PROGRESS_EVERY archivos, no una línea por archivo
+            if done % PROGRESS_EVERY == 0 or done == total:
+                print(f"   - Analizados {done}/{total}")
 
     print()
     print(f"✓ Análisis completado: {len(analyses)} tareas")
@@ -5,218 +5,120 @@ Analiza predictions.jsonl, el reporte de evaluación, y genera un informe comple
 con las interacciones del agent, código generado vs esperado, y análisis de fallos.
 """
 
+import argparse
+import gzip
 import json
 import os
-from collections import defaultdict
+import re
 from datetime import datetime
+from html import escape
 from pathlib import Path
 
+# Archivo modificado en cada cabecera "diff --git a/... b/..." de un patch
+_DIFF_FILE_RE = re.compile(r"^diff --git[ \t]+(\S+)", re.M)
 
-def load_predictions(predictions_path):
-    """Carga las predicciones del agent"""
-    predictions = []
-    if not os.path.exists(predictions_path):
-        print(f"Warning: {predictions_path} not found")
-        return predictions
-
-    with open(predictions_path, encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                predictions.append(json.loads(line))
-    return predictions
-
-
-def load_evaluation_report(report_path):
-    """Carga el reporte de evaluación de SWE-bench"""
-    if not os.path.exists(report_path):
-        print(f"Warning: {report_path} not found")
-        return {}
-
-    with open(report_path, encoding="utf-8") as f:
-        return json.load(f)
-
-
-def load_dataset_instances(dataset_path=None):
-    """Carga las instancias del dataset para obtener info adicional"""
-    # Por ahora retornamos dict vacío, se puede extender para cargar el dataset completo
-    return {}
-
-
-def analyze_patch(patch_text):
-    """Analiza un patch y extrae estadísticas"""
-    if not patch_text or not patch_text.strip():
-        return {
-            "empty": True,
-            "files_changed": 0,
-            "lines_added": 0,
-            "lines_removed": 0,
-            "total_changes": 0,
-        }
-
-    lines = patch_text.split("\n")
-    files_changed = set()
-    lines_added = 0
-    lines_removed = 0
-
-    for line in lines:
-        if line.startswith("diff --git"):
-            # Extract filename
-            parts = line.split()
-            if len(parts) >= 3:
-                files_changed.add(parts[2])
-        elif line.startswith("+") and not line.startswith("+++"):
-            lines_added += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            lines_removed += 1
-
-    return {
-        "empty": False,
-        "files_changed": len(files_changed),
-        "files": list(files_changed),
-        "lines_added": lines_added,
-        "lines_removed": lines_removed,
-        "total_changes": lines_added + lines_removed,
-    }
+# orjson es opcional: parsea bytes directamente y es bastante más rápido
+try:
+    import orjson
 
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-def categorize_failure(instance_id, prediction, eval_result):
-    """Categoriza el tipo de fallo"""
-    patch = prediction.get("model_patch", "")
-
-    if not patch or not patch.strip():
-        return "NO_PATCH", "El agent no generó ningún patch"
-
-    if eval_result is None:
-        return "NOT_EVALUATED", "No se evaluó (posiblemente error de infraestructura)"
 
-    # Aquí se puede extender con más categorías basadas en el eval_result
-    if eval_result.get("resolved", False):
-        return "SUCCESS", "Tarea resuelta correctamente"
-
-    return "PATCH_INCORRECT", "Patch generado pero no pasó los tests"
-
-
-def generate_html_report(predictions, eval_report, output_path):
-    """Genera un reporte HTML detallado"""
-
-    # Estadísticas globales
-    total_tasks = len(predictions)
-    tasks_with_patches = sum(1 for p in predictions if p.get("model_patch", "").strip())
-
-    # Categorizar resultados
-    resolved = (
-        eval_report.get("resolved_ids", eval_report.get("resolved", []))
-        if isinstance(eval_report, dict)
-        else []
-    )
-    resolved_ids = set(resolved) if isinstance(resolved, list) else set()
-
-    categorized = defaultdict(list)
-    for pred in predictions:
-        instance_id = pred["instance_id"]
-        is_resolved = instance_id in resolved_ids
-
-        if is_resolved:
-            category = "SUCCESS"
-        elif not pred.get("model_patch", "").strip():
-            category = "NO_PATCH"
-        else:
-            category = "PATCH_INCORRECT"
-
-        categorized[category].append(pred)
-
-    # Generar HTML
-    html = f"""<!DOCTYPE html>
+# Partes estáticas del reporte HTML (sin interpolación)
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Reporte Detallado SWE-bench - {datetime.now().strftime("%Y-%m-%d %H:%M")}</title>
-    <style>
-        body {{
+"""
+
+_HTML_STYLE = """    <style>
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 36px;
             font-weight: bold;
             color: #667eea;
             margin: 10px 0;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #666;
             font-size: 14px;
             text-transform: uppercase;
-        }}
-        .category {{
+        }
+        .category {
             background: white;
             margin-bottom: 30px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .category-header {{
+        }
+        .category-header {
             padding: 20px;
             font-size: 20px;
             font-weight: bold;
             border-bottom: 2px solid #f0f0f0;
-        }}
-        .category-header.success {{ background: #d4edda; color: #155724; }}
-        .category-header.failed {{ background: #f8d7da; color: #721c24; }}
-        .category-header.no-patch {{ background: #fff3cd; color: #856404; }}
+        }
+        .category-header.success { background: #d4edda; color: #155724; }
+        .category-header.failed { background: #f8d7da; color: #721c24; }
+        .category-header.no-patch { background: #fff3cd; color: #856404; }
 
-        .task {{
+        .task {
             border-bottom: 1px solid #f0f0f0;
             padding: 20px;
-        }}
-        .task:last-child {{ border-bottom: none; }}
+        }
+        .task:last-child { border-bottom: none; }
 
-        .task-header {{
+        .task-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 15px;
-        }}
-        .task-id {{
+        }
+        .task-id {
             font-weight: bold;
             color: #333;
             font-size: 16px;
-        }}
-        .task-status {{
+        }
+        .task-status {
             padding: 5px 15px;
             border-radius: 20px;
             font-size: 12px;
             font-weight: bold;
-        }}
-        .status-success {{ background: #28a745; color: white; }}
-        .status-failed {{ background: #dc3545; color: white; }}
-        .status-no-patch {{ background: #ffc107; color: #333; }}
+        }
+        .status-success { background: #28a745; color: white; }
+        .status-failed { background: #dc3545; color: white; }
+        .status-no-patch { background: #ffc107; color: #333; }
 
-        .problem-statement {{
+        .problem-statement {
             background: #f8f9fa;
             padding: 15px;
             border-left: 4px solid #667eea;
@@ -226,8 +128,8 @@ def generate_html_report(predictions, eval_report, output_path):
             overflow-x: auto;
             max-height: 200px;
             overflow-y: auto;
-        }}
-        .patch {{
+        }
+        .patch {
             background: #1e1e1e;
             color: #d4d4d4;
             padding: 15px;
@@ -238,8 +140,8 @@ def generate_html_report(predictions, eval_report, output_path):
             overflow-x: auto;
             max-height: 400px;
             overflow-y: auto;
-        }}
-        .patch-empty {{
+        }
+        .patch-empty {
             background: #fff3cd;
             color: #856404;
             padding: 15px;
@@ -247,21 +149,21 @@ def generate_html_report(predictions, eval_report, output_path):
             margin: 15px 0;
             text-align: center;
             font-style: italic;
-        }}
-        .patch-stats {{
+        }
+        .patch-stats {
             display: flex;
             gap: 20px;
             margin: 10px 0;
             font-size: 13px;
-        }}
-        .patch-stat {{
+        }
+        .patch-stat {
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
-        .added {{ color: #28a745; }}
-        .removed {{ color: #dc3545; }}
-        .toggle-btn {{
+        }
+        .added { color: #28a745; }
+        .removed { color: #dc3545; }
+        .toggle-btn {
             background: #667eea;
             color: white;
             border: none;
@@ -270,35 +172,222 @@ def generate_html_report(predictions, eval_report, output_path):
             cursor: pointer;
             font-size: 13px;
             margin-top: 10px;
-        }}
-        .toggle-btn:hover {{
+        }
+        .toggle-btn:hover {
             background: #5568d3;
-        }}
-        .hidden {{
+        }
+        .hidden {
             display: none;
-        }}
-        pre {{
+        }
+        pre {
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
-        .metric-bar {{
+        }
+        .metric-bar {
             height: 20px;
             background: #e0e0e0;
             border-radius: 10px;
             overflow: hidden;
             margin: 10px 0;
-        }}
-        .metric-fill {{
+        }
+        .metric-fill {
             height: 100%;
             background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
             transition: width 0.3s ease;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+# Plantillas por tarea, rellenadas con format_map
+_TASK_TPL = """
+        <div class="task">
+            <div class="task-header">
+                <div class="task-id">{instance_id}</div>
+                <div class="task-status {status_class}">{status_text}</div>
+            </div>
+"""
+
+_STATS_TPL = """
+            <div class="patch-stats">
+                <div class="patch-stat">
+                    📁 <strong>{files_changed}</strong> archivo(s) modificado(s)
+                </div>
+                <div class="patch-stat added">
+                    + <strong>{lines_added}</strong> líneas
+                </div>
+                <div class="patch-stat removed">
+                    - <strong>{lines_removed}</strong> líneas
+                </div>
+            </div>
+"""
+
+_PATCH_TPL = """
+            <button class="toggle-btn" onclick="togglePatch('{patch_id}')">Mostrar Patch</button>
+            <div id="{patch_id}" class="patch hidden">
+                <pre>{patch_escaped}</pre>
+            </div>
+"""
+
+_PATCH_EMPTY_HTML = """
+            <div class="patch-empty">
+                ⚠️ No se generó ningún patch para esta tarea
+            </div>
+"""
+
+
+def open_report(output_path):
+    """Abre un reporte para escritura; si la ruta termina en .gz se comprime con gzip"""
+    if str(output_path).endswith(".gz"):
+        # compresslevel=1: casi a velocidad de copia y los diffs comprimen 5-10x
+        return gzip.open(output_path, "wt", encoding="utf-8", compresslevel=1)
+    return open(output_path, "w", encoding="utf-8")
+
+
+def load_predictions(predictions_path):
+    """Carga las predicciones del agent"""
+    predictions = []
+    if not os.path.exists(predictions_path):
+        print(f"Warning: {predictions_path} not found")
+        return predictions
+
+    with open(predictions_path, "rb", buffering=1 << 16) as f:
+        for line in f:
+            if line.strip():
+                predictions.append(_loads(line))
+    return predictions
+
+
+def load_evaluation_report(report_path):
+    """Carga el reporte de evaluación de SWE-bench"""
+    if not os.path.exists(report_path):
+        print(f"Warning: {report_path} not found")
+        return {}
+
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_dataset_instances(dataset_path=None):
+    """Carga las instancias del dataset para obtener info adicional"""
+    # Por ahora retornamos dict vacío, se puede extender para cargar el dataset completo
+    return {}
+
+
+def analyze_patch(patch_text):
+    """Analiza un patch y extrae estadísticas"""
+    if not patch_text or not patch_text.strip():
+        return {
+            "empty": True,
+            "files_changed": 0,
+            "lines_added": 0,
+            "lines_removed": 0,
+            "total_changes": 0,
+        }
+
+    # Conteos con str.count/regex (en C) en lugar de recorrer línea a línea.
+    # El "\n" inicial hace que la primera línea también cuente como inicio.
+    text = "\n" + patch_text
+    lines_added = text.count("\n+") - text.count("\n+++")
+    lines_removed = text.count("\n-") - text.count("\n---")
+    files_changed = list(dict.fromkeys(_DIFF_FILE_RE.findall(patch_text)))
+
+    return {
+        "empty": False,
+        "files_changed": len(files_changed),
+        "files": files_changed,
+        "lines_added": lines_added,
+        "lines_removed": lines_removed,
+        "total_changes": lines_added + lines_removed,
+    }
+
+
+def get_patch_analysis(pred):
+    """Devuelve el análisis del patch de una predicción, calculándolo una sola vez"""
+    analysis = pred.get("_patch_analysis")
+    if analysis is None:
+        analysis = pred["_patch_analysis"] = analyze_patch(pred.get("model_patch", ""))
+    return analysis
+
+
+def categorize_failure(instance_id, prediction, eval_result):
+    """Categoriza el tipo de fallo"""
+    patch = prediction.get("model_patch", "")
+
+    if not patch or not patch.strip():
+        return "NO_PATCH", "El agent no generó ningún patch"
+
+    if eval_result is None:
+        return "NOT_EVALUATED", "No se evaluó (posiblemente error de infraestructura)"
+
+    # Aquí se puede extender con más categorías basadas en el eval_result
+    if eval_result.get("resolved", False):
+        return "SUCCESS", "Tarea resuelta correctamente"
+
+    return "PATCH_INCORRECT", "Patch generado pero no pasó los tests"
+
+
+def _pct(count, total):
+    """Porcentaje de ``count`` sobre ``total`` (0 si no hay tareas)"""
+    return count / total * 100 if total else 0.0
+
+
+def categorize_predictions(predictions, eval_report):
+    """Clasifica cada predicción según el reporte de evaluación.
+
+    Devuelve ``((success, patch_incorrect, no_patch), resolved_ids)``; ambos reportes usan
+    estas listas para que coincidan.
+    """
+    resolved = (
+        eval_report.get("resolved_ids", eval_report.get("resolved", []))
+        if isinstance(eval_report, dict)
+        else []
+    )
+    resolved_ids = set(resolved) if isinstance(resolved, list) else set()
+
+    success, patch_incorrect, no_patch = [], [], []
+    for pred in predictions:
+        if pred["instance_id"] in resolved_ids:
+            success.append(pred)
+        elif get_patch_analysis(pred)["empty"]:
+            no_patch.append(pred)
+        else:
+            patch_incorrect.append(pred)
+
+    return (success, patch_incorrect, no_patch), resolved_ids
+
+
+def generate_html_report(predictions, eval_report, output_path, now=None, categorization=None):
+    """Genera un reporte HTML detallado.
+
+    ``now`` es la fecha de generación (por defecto la actual) y ``categorization``
+    el resultado de ``categorize_predictions`` si ya se calculó.
+    """
+
+    # Estadísticas globales
+    total_tasks = len(predictions)
+    tasks_with_patches = sum(1 for p in predictions if not get_patch_analysis(p)["empty"])
+
+    # Categorizar resultados
+    if categorization is None:
+        categorization = categorize_predictions(predictions, eval_report)
+    (success, patch_incorrect, no_patch), _ = categorization
+
+    pct_patches = _pct(tasks_with_patches, total_tasks)
+    pct_success = _pct(len(success), total_tasks)
+
+    # Generar HTML: se acumulan fragmentos y se escriben al final con writelines
+    parts = []
+    now = now or datetime.now()
+    parts.append(_HTML_HEAD)
+    parts.append(
+        f"    <title>Reporte Detallado SWE-bench - {now.strftime('%Y-%m-%d %H:%M')}</title>\n"
+    )
+    parts.append(_HTML_STYLE)
+    parts.append(f"""    <div class="header">
         <h1>📊 Reporte Detallado de Evaluación SWE-bench</h1>
-        <p>Generado: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+        <p>Generado: {now.strftime("%Y-%m-%d %H:%M:%S")}</p>
     </div>
 
     <div class="stats">
@@ -310,63 +399,63 @@ def generate_html_report(predictions, eval_report, output_path):
             <div class="stat-label">Patches Generados</div>
             <div class="stat-number">{tasks_with_patches}</div>
             <div class="metric-bar">
-                <div class="metric-fill" style="width: {tasks_with_patches / total_tasks * 100:.1f}%"></div>
+                <div class="metric-fill" style="width: {pct_patches:.1f}%"></div>
             </div>
         </div>
         <div class="stat-card">
             <div class="stat-label">Resueltas Correctamente</div>
-            <div class="stat-number" style="color: #28a745;">{len(categorized["SUCCESS"])}</div>
+            <div class="stat-number" style="color: #28a745;">{len(success)}</div>
             <div class="metric-bar">
-                <div class="metric-fill" style="width: {len(categorized["SUCCESS"]) / total_tasks * 100:.1f}%; background: #28a745;"></div>
+                <div class="metric-fill" style="width: {pct_success:.1f}%; background: #28a745;"></div>
             </div>
         </div>
         <div class="stat-card">
             <div class="stat-label">Tasa de Éxito</div>
-            <div class="stat-number">{len(categorized["SUCCESS"]) / total_tasks * 100:.1f}%</div>
+            <div class="stat-number">{pct_success:.1f}%</div>
         </div>
     </div>
-"""
+""")
 
     # Sección de tareas exitosas
-    if categorized["SUCCESS"]:
-        html += f"""
+    if success:
+        parts.append(f"""
     <div class="category">
         <div class="category-header success">
-            ✅ Tareas Resueltas Correctamente ({len(categorized["SUCCESS"])})
+            ✅ Tareas Resueltas Correctamente ({len(success)})
         </div>
-"""
-        for pred in categorized["SUCCESS"]:
-            patch_analysis = analyze_patch(pred.get("model_patch", ""))
-            html += generate_task_html(pred, "success", patch_analysis)
-        html += "    </div>\n"
+""")
+        for pred in success:
+            patch_analysis = get_patch_analysis(pred)
+            generate_task_html(parts.append, pred, "success", patch_analysis)
+        parts.append("    </div>\n")
 
     # Sección de tareas con patch incorrecto
-    if categorized["PATCH_INCORRECT"]:
-        html += f"""
+    if patch_incorrect:
+        parts.append(f"""
     <div class="category">
         <div class="category-header failed">
-            ❌ Patches Generados pero Incorrectos ({len(categorized["PATCH_INCORRECT"])})
+            ❌ Patches Generados pero Incorrectos ({len(patch_incorrect)})
         </div>
-"""
-        for pred in categorized["PATCH_INCORRECT"]:
-            patch_analysis = analyze_patch(pred.get("model_patch", ""))
-            html += generate_task_html(pred, "failed", patch_analysis)
-        html += "    </div>\n"
+""")
+        for pred in patch_incorrect:
+            patch_analysis = get_patch_analysis(pred)
+            generate_task_html(parts.append, pred, "failed", patch_analysis)
+        parts.append("    </div>\n")
 
     # Sección de tareas sin patch
-    if categorized["NO_PATCH"]:
-        html += f"""
+    if no_patch:
+        parts.append(f"""
     <div class="category">
         <div class="category-header no-patch">
-            ⚠️ Tareas sin Patch Generado ({len(categorized["NO_PATCH"])})
+            ⚠️ Tareas sin Patch Generado ({len(no_patch)})
         </div>
-"""
-        for pred in categorized["NO_PATCH"]:
-            patch_analysis = analyze_patch(pred.get("model_patch", ""))
-            html += generate_task_html(pred, "no-patch", patch_analysis)
-        html += "    </div>\n"
+""")
+        for pred in no_patch:
+            patch_analysis = get_patch_analysis(pred)
+            generate_task_html(parts.append, pred, "no-patch", patch_analysis)
+        parts.append("    </div>\n")
 
-    html += """
+    parts.append("""
     <script>
         function togglePatch(id) {
             const element = document.getElementById(id);
@@ -377,16 +466,16 @@ def generate_html_report(predictions, eval_report, output_path):
     </script>
 </body>
 </html>
-"""
+""")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with open_report(output_path) as f:
+        f.writelines(parts)
 
     print(f"✓ Reporte HTML generado: {output_path}")
 
 
-def generate_task_html(pred, status, patch_analysis):
-    """Genera el HTML para una tarea individual"""
+def generate_task_html(write, pred, status, patch_analysis):
+    """Escribe el HTML de una tarea individual con ``write`` (p.ej. f.write o list.append)"""
     instance_id = pred["instance_id"]
     patch = pred.get("model_patch", "")
 
@@ -395,139 +484,142 @@ def generate_task_html(pred, status, patch_analysis):
         status, "DESCONOCIDO"
     )
 
-    html = f"""
-        <div class="task">
-            <div class="task-header">
-                <div class="task-id">{instance_id}</div>
-                <div class="task-status {status_class}">{status_text}</div>
-            </div>
-"""
+    write(
+        _TASK_TPL.format_map(
+            {"instance_id": instance_id, "status_class": status_class, "status_text": status_text}
+        )
+    )
 
     # Estadísticas del patch si existe
     if not patch_analysis["empty"]:
-        html += f"""
-            <div class="patch-stats">
-                <div class="patch-stat">
-                    📁 <strong>{patch_analysis["files_changed"]}</strong> archivo(s) modificado(s)
-                </div>
-                <div class="patch-stat added">
-                    + <strong>{patch_analysis["lines_added"]}</strong> líneas
-                </div>
-                <div class="patch-stat removed">
-                    - <strong>{patch_analysis["lines_removed"]}</strong> líneas
-                </div>
-            </div>
-"""
+        write(_STATS_TPL.format_map(patch_analysis))
         if patch_analysis["files"]:
-            html += f"""
+            write(f"""
             <div style="font-size: 12px; color: #666; margin: 5px 0;">
                 Archivos: {", ".join(patch_analysis["files"])}
             </div>
-"""
+""")
 
     # Patch generado
     patch_id = f"patch-{instance_id.replace('__', '-').replace('_', '-')}"
-    if patch and patch.strip():
+    if not patch_analysis["empty"]:
         # Escape HTML characters
-        patch_escaped = patch.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        html += f"""
-            <button class="toggle-btn" onclick="togglePatch('{patch_id}')">Mostrar Patch</button>
-            <div id="{patch_id}" class="patch hidden">
-                <pre>{patch_escaped}</pre>
-            </div>
-"""
+        patch_escaped = escape(patch, quote=False)
+        write(_PATCH_TPL.format_map({"patch_id": patch_id, "patch_escaped": patch_escaped}))
     else:
-        html += """
-            <div class="patch-empty">
-                ⚠️ No se generó ningún patch para esta tarea
-            </div>
-"""
+        write(_PATCH_EMPTY_HTML)
+
+    write("        </div>\n")
 
-    html += "        </div>\n"
-    return html
 
+# Categoría -> (emoji, texto) del estado en el reporte Markdown
+_MD_STATUS = {
+    "SUCCESS": ("✅", "RESUELTO"),
+    "PATCH_INCORRECT": ("❌", "INCORRECTO"),
+    "NO_PATCH": ("⚠️", "SIN PATCH"),
+}
 
-def generate_markdown_report(predictions, eval_report, output_path):
-    """Genera un reporte en formato Markdown"""
+
+def generate_markdown_report(predictions, eval_report, output_path, now=None, categorization=None):
+    """Genera un reporte en formato Markdown.
+
+    ``now`` es la fecha de generación (por defecto la actual) y ``categorization``
+    el resultado de ``categorize_predictions`` si ya se calculó.
+    """
+
+    now = now or datetime.now()
 
     total_tasks = len(predictions)
-    tasks_with_patches = sum(1 for p in predictions if p.get("model_patch", "").strip())
+    tasks_with_patches = sum(1 for p in predictions if not get_patch_analysis(p)["empty"])
 
-    resolved = (
-        eval_report.get("resolved_ids", eval_report.get("resolved", []))
-        if isinstance(eval_report, dict)
-        else []
-    )
-    resolved_ids = set(resolved) if isinstance(resolved, list) else set()
+    if categorization is None:
+        categorization = categorize_predictions(predictions, eval_report)
+    _, resolved_ids = categorization
 
-    md = f"""# 📊 Reporte Detallado de Evaluación SWE-bench
+    resolved_count = len(resolved_ids)
+    incorrect_count = tasks_with_patches - resolved_count
+    no_patch_count = total_tasks - tasks_with_patches
 
-**Generado**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    parts = []
+    parts.append(f"""# 📊 Reporte Detallado de Evaluación SWE-bench
+
+**Generado**: {now.strftime("%Y-%m-%d %H:%M:%S")}
 
 ## Resumen Ejecutivo
 
 | Métrica | Valor | Porcentaje |
 |---------|-------|------------|
 | Total de Tareas | {total_tasks} | 100% |
-| Patches Generados | {tasks_with_patches} | {tasks_with_patches / total_tasks * 100:.1f}% |
-| Resueltas Correctamente | {len(resolved_ids)} | {len(resolved_ids) / total_tasks * 100:.1f}% |
-| Con Patch Incorrecto | {tasks_with_patches - len(resolved_ids)} | {(tasks_with_patches - len(resolved_ids)) / total_tasks * 100:.1f}% |
-| Sin Patch | {total_tasks - tasks_with_patches} | {(total_tasks - tasks_with_patches) / total_tasks * 100:.1f}% |
+| Patches Generados | {tasks_with_patches} | {_pct(tasks_with_patches, total_tasks):.1f}% |
+| Resueltas Correctamente | {resolved_count} | {_pct(resolved_count, total_tasks):.1f}% |
+| Con Patch Incorrecto | {incorrect_count} | {_pct(incorrect_count, total_tasks):.1f}% |
+| Sin Patch | {no_patch_count} | {_pct(no_patch_count, total_tasks):.1f}% |
 
 ---
 
-"""
+""")
 
     # Análisis detallado de cada tarea
     for i, pred in enumerate(predictions, 1):
         instance_id = pred["instance_id"]
         patch = pred.get("model_patch", "")
-        is_resolved = instance_id in resolved_ids
-
-        status_emoji = "✅" if is_resolved else ("❌" if patch.strip() else "⚠️")
-        status_text = (
-            "RESUELTO" if is_resolved else ("INCORRECTO" if patch.strip() else "SIN PATCH")
-        )
+        patch_analysis = get_patch_analysis(pred)
+        has_patch = not patch_analysis["empty"]
+        # Estado por predicción: el mismo instance_id puede repetirse
+        if instance_id in resolved_ids:
+            category = "SUCCESS"
+        elif has_patch:
+            category = "PATCH_INCORRECT"
+        else:
+            category = "NO_PATCH"
+        status_emoji, status_text = _MD_STATUS[category]
 
-        md += f"""## {i}. {status_emoji} {instance_id}
+        parts.append(f"""## {i}. {status_emoji} {instance_id}
 
 **Estado**: {status_text}
 
-"""
+""")
 
-        patch_analysis = analyze_patch(patch)
-        if not patch_analysis["empty"]:
-            md += f"""### Estadísticas del Patch
+        if has_patch:
+            parts.append(f"""### Estadísticas del Patch
 - **Archivos modificados**: {patch_analysis["files_changed"]}
 - **Líneas agregadas**: {patch_analysis["lines_added"]}
 - **Líneas eliminadas**: {patch_analysis["lines_removed"]}
 - **Cambios totales**: {patch_analysis["total_changes"]}
 
-"""
+""")
             if patch_analysis["files"]:
-                md += f"**Archivos**: `{'`, `'.join(patch_analysis['files'])}`\n\n"
+                parts.append(f"**Archivos**: `{'`, `'.join(patch_analysis['files'])}`\n\n")
 
-        if patch and patch.strip():
-            md += f"""### Patch Generado
+        if has_patch:
+            parts.append(f"""### Patch Generado
 
 ```diff
 {patch}
 ```
 
-"""
+""")
         else:
-            md += "### ⚠️ No se generó ningún patch\n\n"
+            parts.append("### ⚠️ No se generó ningún patch\n\n")
 
-        md += "---\n\n"
+        parts.append("---\n\n")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(md)
+    with open_report(output_path) as f:
+        f.writelines(parts)
 
     print(f"✓ Reporte Markdown generado: {output_path}")
 
 
 def main():
     """Función principal"""
+    parser = argparse.ArgumentParser(description="Genera el reporte detallado de SWE-bench")
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Comprime el reporte Markdown (.md.gz); útil cuando los patches son muy grandes",
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("  Generador de Reporte Detallado SWE-bench")
     print("=" * 70)
@@ -543,20 +635,37 @@ def main():
     predictions = load_predictions(predictions_path)
     eval_report = load_evaluation_report(report_path)
 
+    # Analizar y clasificar cada predicción una sola vez; ambos reportes
+    # reutilizan el resultado
+    categorization = categorize_predictions(predictions, eval_report)
+
     print(f"   - Predicciones cargadas: {len(predictions)}")
     print(f"   - Reporte de evaluación: {'✓' if eval_report else '✗'}")
     print()
 
+    if not predictions:
+        print("⚠️  No hay predicciones; no se genera ningún reporte")
+        return
+
     # Generar reportes
     print("📝 Generando reportes...")
 
+    # Una sola marca de tiempo: ambos reportes comparten nombre y fecha
+    now = datetime.now()
+    stamp = now.strftime("%Y%m%d_%H%M%S")
+
     # Reporte HTML
-    html_output = base_dir / f"reporte_detallado_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-    generate_html_report(predictions, eval_report, html_output)
+    html_output = base_dir / f"reporte_detallado_{stamp}.html"
+    generate_html_report(
+        predictions, eval_report, html_output, now=now, categorization=categorization
+    )
 
-    # Reporte Markdown
-    md_output = base_dir / f"reporte_detallado_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-    generate_markdown_report(predictions, eval_report, md_output)
+    # Reporte Markdown (incluye los patches completos; --gzip lo comprime)
+    md_suffix = ".md.gz" if args.gzip else ".md"
+    md_output = base_dir / f"reporte_detallado_{stamp}{md_suffix}"
+    generate_markdown_report(
+        predictions, eval_report, md_output, now=now, categorization=categorization
+    )
 
     print()
     print("=" * 70)
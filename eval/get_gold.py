@@ -1,14 +1,19 @@
-from datasets import load_dataset
+def main():
+    # Heavy (pyarrow/pandas); imported only when the script runs
+    from datasets import load_dataset
 
-instance_id = "astropy__astropy-12907"
-print(f"Loading dataset for {instance_id}...")
-dataset = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
-# Filter
-filtered = dataset.filter(lambda x: x["instance_id"] == instance_id)
-
-if len(filtered) > 0:
-    entry = filtered[0]
+    instance_id = "astropy__astropy-12907"
+    print(f"Loading dataset for {instance_id}...")
+    dataset = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
+    # Look up the row through the id column instead of a per-row Python filter
+    try:
+        entry = dataset[dataset["instance_id"].index(instance_id)]
+    except ValueError:
+        print("Instance not found.")
+        return
     print(f"--- Gold Patch for {instance_id} ---")
     print(entry["patch"])
-else:
-    print("Instance not found.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,5 @@
-import sys
-from unittest.mock import MagicMock
-
-# Mock resource
-if sys.platform == "win32":
-    sys.modules["resource"] = MagicMock()
+# Stub 'resource' on Windows before swebench imports it
+import _resource_shim  # noqa: F401
 
 try:
     import inspect
@@ -1,13 +1,62 @@
 import argparse
 import asyncio
+import itertools
 import json
 import os
 import shutil
 import subprocess
+import threading
+from collections import deque
+from pathlib import Path
 
 # Import our solver
 from agent_wrapper import SWESolver
-from datasets import load_dataset
+
+# orjson is optional; it serializes prediction records noticeably faster
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _dumps = json.dumps
+
+# Bare mirrors shared by every instance of the same repo
+MIRROR_DIR = Path.home() / ".cache" / "swebench_mirrors"
+_mirror_locks = {}
+_fresh_mirrors = set()
+
+
+def ensure_mirror(repo, repo_url):
+    """
+    Returns the path of a local bare mirror of the repo, creating it on first
+    use and refreshing it once per run. Every instance of the same repo is
+    then cloned from disk instead of from GitHub.
+    """
+    mirror = MIRROR_DIR / f"{repo.replace('/', '__')}.git"
+    with _mirror_locks.setdefault(repo, threading.Lock()):
+        if repo in _fresh_mirrors:
+            return mirror
+        if mirror.exists():
+            print(f"Updating mirror {mirror}...")
+            subprocess.run(["git", "-C", str(mirror), "fetch", "--prune"], check=False)
+        else:
+            print(f"Creating mirror of {repo} at {mirror}...")
+            MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+            subprocess.run(["git", "clone", "--mirror", repo_url, str(mirror)], check=True)
+        _fresh_mirrors.add(repo)
+    return mirror
+
+
+def clone_from_mirror(repo, repo_url, work_dir):
+    """
+    Clones work_dir from the local mirror (git hardlinks the objects, so this
+    costs no network and little disk) and points origin back at GitHub.
+    """
+    mirror = ensure_mirror(repo, repo_url)
+    subprocess.run(["git", "clone", "--no-checkout", str(mirror), work_dir], check=True)
+    subprocess.run(["git", "-C", work_dir, "remote", "set-url", "origin", repo_url], check=True)
 
 
 def clone_repo(repo, commit, work_dir):
@@ -41,18 +90,20 @@ def clone_repo(repo, commit, work_dir):
             print(f"Directory {work_dir} exists but not a git repo. Removing...")
             shutil.rmtree(work_dir)
             print(f"Cloning {repo} to {work_dir}...")
-            subprocess.run(["git", "clone", repo_url, work_dir], check=True)
+            clone_from_mirror(repo, repo_url, work_dir)
     else:
         print(f"Cloning {repo} to {work_dir}...")
-        subprocess.run(["git", "clone", repo_url, work_dir], check=True)
+        clone_from_mirror(repo, repo_url, work_dir)
 
     print(f"Checking out {commit}...")
     subprocess.run(["git", "checkout", "-f", commit], cwd=work_dir, check=True)
 
 
 def get_diff(work_dir):
-    result = subprocess.run(["git", "diff"], cwd=work_dir, capture_output=True, text=True)
-    return result.stdout
+    # Read raw bytes and decode once; text=True would add a newline-translation pass
+    proc = subprocess.Popen(["git", "diff"], cwd=work_dir, stdout=subprocess.PIPE, bufsize=1 << 20)
+    data, _ = proc.communicate()
+    return data.decode("utf-8", "replace")
 
 
 def main():
@@ -61,8 +112,12 @@ def main():
     parser.add_argument("--output", default="eval/predictions.jsonl", help="Output file")
     parser.add_argument("--repo_dir_base", default="eval/repos", help="Where to clone repos")
     parser.add_argument("--instance_id", help="Run a specific instance ID")
+    parser.add_argument("--max_workers", type=int, default=4, help="Repos to clone concurrently")
     args = parser.parse_args()
 
+    # Heavy (pyarrow/pandas); imported only once the arguments are valid
+    from datasets import load_dataset
+
     print("Loading dataset...")
     try:
         dataset = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
@@ -72,70 +127,99 @@ def main():
 
     # Filter if needed
     if args.instance_id:
-        dataset = dataset.filter(lambda x: x["instance_id"] == args.instance_id)
-        if len(dataset) == 0:
+        # Look up the row through the id column instead of a per-row Python filter
+        try:
+            index = dataset["instance_id"].index(args.instance_id)
+        except ValueError:
             print(f"No instance found with ID {args.instance_id}")
             return
+        dataset = dataset.select([index])
         print(f"Filtered to 1 instance: {args.instance_id}")
     else:
         # Take the first N
         dataset = dataset.select(range(min(len(dataset), args.limit)))
         print(f"Selected {len(dataset)} instances.")
 
+    # Convert the selected rows once so the task loop works on plain dicts
+    # instead of going through Arrow for every row access
+    items = dataset.to_list()
+
     # Prepare output
-    asyncio.run(run_tasks(dataset, args.repo_dir_base, args.output))
+    asyncio.run(run_tasks(items, args.repo_dir_base, args.output, args.max_workers))
 
 
-async def run_tasks(dataset, repo_dir_base, output_file):
+async def run_tasks(dataset, repo_dir_base, output_file, max_workers=4):
     print("Initializing solver with deepseek-chat...")
     solver = SWESolver(model_override="deepseek-chat")
 
-    # Create repos dir
+    # Create repos dir. Absolute, because solve() chdirs into each repo while
+    # the next clones are still running in background threads.
+    repo_dir_base = os.path.abspath(repo_dir_base)
     os.makedirs(repo_dir_base, exist_ok=True)
 
-    try:
-        for i, item in enumerate(dataset):
-            instance_id = item["instance_id"]
-            repo = item["repo"]
-            base_commit = item["base_commit"]
-            problem_statement = item["problem_statement"]
-
-            print(f"\n[{i + 1}/{len(dataset)}] Processing {instance_id}...")
-
-            repo_name = repo.split("/")[-1]
-            work_dir = os.path.join(repo_dir_base, f"{repo_name}_{instance_id}")
-
-            # Clone and setup
-            try:
-                clone_repo(repo, base_commit, work_dir)
-            except Exception as e:
-                print(f"Failed to clone/checkout: {e}")
-                continue
-
-            # Solve
-            await solver.solve(problem_statement, work_dir)
-
-            # Get patch
-            patch = get_diff(work_dir)
-
-            # If patch is empty, maybe the agent failed to edit?
-            if not patch.strip():
-                print("WARNING: No patch generated!")
-            else:
-                print(f"Patch generated ({len(patch)} chars).")
-
-            results = {
-                "instance_id": instance_id,
-                "model_patch": patch,
-                "model_name_or_path": "CodeAgent-v1",
-            }
-
-            # Append to file immediately
-            with open(output_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(results) + "\n")
-
-    finally:
-        await solver.close()
+    # Clones are I/O bound and independent, so up to max_workers of them are
+    # prefetched while the agent works. solve() itself stays sequential: it
+    # changes the process CWD and reuses a single agent team.
+    async def prepare(item):
+        repo_name = item["repo"].split("/")[-1]
+        work_dir = os.path.join(repo_dir_base, f"{repo_name}_{item['instance_id']}")
+        await asyncio.to_thread(clone_repo, item["repo"], item["base_commit"], work_dir)
+        return work_dir
+
+    # Look-ahead window of (item, clone task); only max_workers clones exist at once
+    remaining = iter(dataset)
+    pending = deque()
+
+    def prefetch():
+        for item in itertools.islice(remaining, max(max_workers, 1) - len(pending)):
+            pending.append((item, asyncio.create_task(prepare(item))))
+
+    # Absolute for the same reason as repo_dir_base; opened once for the whole run
+    with open(os.path.abspath(output_file), "a", encoding="utf-8", buffering=1 << 16) as out_f:
+        try:
+            for i in range(len(dataset)):
+                # The previous clone has finished, so the window has a free slot
+                prefetch()
+                item, clone = pending.popleft()
+                instance_id = item["instance_id"]
+                problem_statement = item["problem_statement"]
+
+                print(f"\n[{i + 1}/{len(dataset)}] Processing {instance_id}...")
+
+                # Clone and setup
+                try:
+                    work_dir = await clone
+                except Exception as e:
+                    print(f"Failed to clone/checkout: {e}")
+                    continue
+
+                # Solve
+                await solver.solve(problem_statement, work_dir)
+
+                # Get patch
+                patch = await asyncio.to_thread(get_diff, work_dir)
+
+                # If patch is empty, maybe the agent failed to edit?
+                if not patch.strip():
+                    print("WARNING: No patch generated!")
+                else:
+                    print(f"Patch generated ({len(patch)} chars).")
+
+                results = {
+                    "instance_id": instance_id,
+                    "model_patch": patch,
+                    "model_name_or_path": "CodeAgent-v1",
+                }
+
+                # Append to file immediately (flush keeps finished tasks if we crash)
+                out_f.write(_dumps(results) + "\n")
+                out_f.flush()
+
+        finally:
+            # Clones already running in threads cannot be cancelled; wait for the
+            # few in the window so none is left unretrieved or half-written
+            await asyncio.gather(*(clone for _, clone in pending), return_exceptions=True)
+            await solver.close()
 
 
 if __name__ == "__main__":
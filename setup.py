@@ -54,6 +54,11 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        # Optional faster event loop and JSON
+        "speedups": [
+            "uvloop>=0.18.0; sys_platform != 'win32'",
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
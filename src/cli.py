@@ -4,7 +4,6 @@ Este archivo se ejecuta cuando el usuario escribe 'daveagent' en la terminal
 """
 
 import argparse
-import asyncio
 import os
 import sys
 from pathlib import Path
@@ -111,6 +110,7 @@ def main():
 
     # Import main from src
     from src.main import main as run_daveagent
+    from src.main import run_event_loop
 
     # Show working directory information
     working_dir = Path.cwd()
@@ -129,7 +129,7 @@ def main():
         elif args.ssl_verify:
             ssl_verify = args.ssl_verify.lower() == "true"
 
-        asyncio.run(
+        run_event_loop(
             run_daveagent(
                 debug=args.debug,
                 api_key=args.api_key,
@@ -4,7 +4,9 @@ Handles model clients, tools, agents, and team creation
 """
 
 # IMPORTANTE: Filtros de warnings ANTES de todos los imports
+import re
 import warnings
+from functools import lru_cache
 
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="autogen.import_utils")
 warnings.filterwarnings(
@@ -22,7 +24,7 @@ from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, TextMessage
 from autogen_agentchat.teams import SelectorGroupChat
-from autogen_core.model_context import BufferedChatCompletionContext
+from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 # Ensure we use local src files over installed packages
@@ -39,7 +41,176 @@ from src.config.prompts import (
 from src.interfaces import CLIInterface
 
 # Managers moved to __init__
-from src.utils import HistoryViewer, LoggingModelClientWrapper, get_conversation_tracker, get_logger
+from src.utils import (
+    ChunkedChatCompletionContext,
+    HistoryViewer,
+    LoggingModelClientWrapper,
+    get_conversation_tracker,
+    get_logger,
+)
+
+# httpx drops idle pooled connections after 5s by default, which is shorter than
+# most tool runs between two model calls, so each call paid a new TLS handshake.
+# Servers closing idle sockets earlier is fine: httpcore discards those on checkout.
+HTTP_KEEPALIVE_EXPIRY = 90.0
+
+
+def create_http_client(ssl_verify: bool = True):
+    """
+    Build the httpx client shared by every model client of an orchestrator
+
+    Args:
+        ssl_verify: Whether to verify SSL certificates
+
+    Returns:
+        httpx.AsyncClient with a long-lived keep-alive pool
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        verify=ssl_verify,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+# Requests that are a single direct command: a shell-style command (git, ls,
+# cat, grep) or a read/show/list/find/open verb followed by a path or file name.
+# The Coder finishes these on its own (simple mode in its prompt), so the router
+# skips the Planner turn. Plain English such as "show me how X works" still
+# goes to the Planner.
+DIRECT_REQUEST_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?:git|ls|cat|grep)\b"
+    r"|(?:read|show|list|find|open)\s+(?:the\s+)?(?:\S*[/\\]\S*|[\w-]+\.\w+\b)"
+    r")",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1)
+def _get_base_tools() -> tuple[tuple, tuple]:
+    """
+    Return the (read_only, modification) tool tuples, importing src.tools once.
+
+    The import stays inside a function because src.tools imports src.config
+    back. Tuples, so every orchestrator copies them into its own lists:
+    subagent tools are appended per instance.
+    """
+    from src.tools import (
+        # Analysis
+        analyze_python_file,
+        csv_info,
+        csv_to_json,
+        delete_file,
+        edit_file,
+        file_search,
+        filter_csv,
+        find_function_definition,
+        format_json,
+        git_add,
+        git_branch,
+        git_commit,
+        git_diff,
+        git_log,
+        git_pull,
+        git_push,
+        # Git
+        git_status,
+        glob_search,
+        grep_search,
+        json_get_value,
+        json_set_value,
+        json_to_text,
+        list_all_functions,
+        list_dir,
+        merge_csv_files,
+        merge_json_files,
+        # CSV
+        read_csv,
+        # Filesystem
+        read_file,
+        # JSON
+        read_json,
+        run_terminal_cmd,
+        sort_csv,
+        validate_json,
+        web_search,
+        wiki_content,
+        wiki_page_info,
+        wiki_random,
+        # Web
+        wiki_search,
+        wiki_set_language,
+        wiki_summary,
+        write_csv,
+        write_file,
+        write_json,
+    )
+
+    # READ-ONLY tools (available in both modes)
+    read_only = (
+        read_file,
+        list_dir,
+        file_search,
+        glob_search,
+        git_status,
+        git_log,
+        git_branch,
+        git_diff,
+        read_json,
+        validate_json,
+        json_get_value,
+        json_to_text,
+        read_csv,
+        csv_info,
+        filter_csv,
+        wiki_search,
+        wiki_summary,
+        wiki_content,
+        wiki_page_info,
+        wiki_random,
+        wiki_set_language,
+        web_search,
+        analyze_python_file,
+        find_function_definition,
+        list_all_functions,
+        grep_search,
+    )
+    # MODIFICATION tools (only in agent mode)
+    modification = (
+        write_file,
+        edit_file,
+        delete_file,
+        git_add,
+        git_commit,
+        git_push,
+        git_pull,
+        write_json,
+        merge_json_files,
+        format_json,
+        json_set_value,
+        write_csv,
+        merge_csv_files,
+        csv_to_json,
+        sort_csv,
+        run_terminal_cmd,
+    )
+    return read_only, modification
+
+
+@lru_cache(maxsize=256)
+def _function_tool(func) -> FunctionTool:
+    """
+    Wrap a tool function the way AssistantAgent would, once per process.
+
+    Wrapping inspects the signature and builds a pydantic args model, and the
+    agents are rebuilt on every mode switch and for every subagent.
+    """
+    return FunctionTool(func, description=func.__doc__ or "")
 
 
 class AgentOrchestrator:
@@ -99,10 +270,8 @@ class AgentOrchestrator:
         # DEEPSEEK REASONER SUPPORT
         # Use DeepSeekReasoningClient for models with thinking mode
 
-        # Create custom HTTP client with SSL configuration
-        import httpx
-
-        http_client = httpx.AsyncClient(verify=self.settings.ssl_verify)
+        # Create custom HTTP client with SSL configuration (one pool for all clients)
+        http_client = create_http_client(self.settings.ssl_verify)
 
         # Complete JSON logging system (ALWAYS active, independent of Langfuse)
         # IMPORTANT: Initialize JSONLogger BEFORE creating the model_client wrapper
@@ -232,109 +401,9 @@ class AgentOrchestrator:
         # Start telemetry in background
         threading.Thread(target=init_telemetry_background, daemon=True).start()
 
-        # Import all tools from the new structure
-        from src.tools import (
-            # Analysis
-            analyze_python_file,
-            csv_info,
-            csv_to_json,
-            delete_file,
-            edit_file,
-            file_search,
-            filter_csv,
-            find_function_definition,
-            format_json,
-            git_add,
-            git_branch,
-            git_commit,
-            git_diff,
-            git_log,
-            git_pull,
-            git_push,
-            # Git
-            git_status,
-            glob_search,
-            grep_search,
-            json_get_value,
-            json_set_value,
-            json_to_text,
-            list_all_functions,
-            list_dir,
-            merge_csv_files,
-            merge_json_files,
-            # CSV
-            read_csv,
-            # Filesystem
-            read_file,
-            # JSON
-            read_json,
-            run_terminal_cmd,
-            sort_csv,
-            validate_json,
-            web_search,
-            wiki_content,
-            wiki_page_info,
-            wiki_random,
-            # Web
-            wiki_search,
-            wiki_set_language,
-            wiki_summary,
-            write_csv,
-            write_file,
-            write_json,
-        )
-
         # Store all tools to filter them according to mode
-        self.all_tools = {
-            # READ-ONLY tools (available in both modes)
-            "read_only": [
-                read_file,
-                list_dir,
-                file_search,
-                glob_search,
-                git_status,
-                git_log,
-                git_branch,
-                git_diff,
-                read_json,
-                validate_json,
-                json_get_value,
-                json_to_text,
-                read_csv,
-                csv_info,
-                filter_csv,
-                wiki_search,
-                wiki_summary,
-                wiki_content,
-                wiki_page_info,
-                wiki_random,
-                wiki_set_language,
-                web_search,
-                analyze_python_file,
-                find_function_definition,
-                list_all_functions,
-                grep_search,
-            ],
-            # MODIFICATION tools (only in agent mode)
-            "modification": [
-                write_file,
-                edit_file,
-                delete_file,
-                git_add,
-                git_commit,
-                git_push,
-                git_pull,
-                write_json,
-                merge_json_files,
-                format_json,
-                json_set_value,
-                write_csv,
-                merge_csv_files,
-                csv_to_json,
-                sort_csv,
-                run_terminal_cmd,
-            ],
-        }
+        read_only, modification = _get_base_tools()
+        self.all_tools = {"read_only": list(read_only), "modification": list(modification)}
 
         # =====================================================================
         # MESSAGEBUS SYSTEM INITIALIZATION (FASE 3: Auto-Injection)
@@ -503,8 +572,9 @@ class AgentOrchestrator:
             agent_name="Planner",
         )
 
-        coder_context = BufferedChatCompletionContext(buffer_size=100)
-        planner_context = BufferedChatCompletionContext(buffer_size=100)
+        # Chunked windows keep the prompt prefix stable so provider caching hits
+        coder_context = ChunkedChatCompletionContext(buffer_size=100)
+        planner_context = ChunkedChatCompletionContext(buffer_size=100)
 
         # Create code agent with RAG tools (without memory parameter)
         self.coder_agent = AssistantAgent(
@@ -512,7 +582,7 @@ class AgentOrchestrator:
             description=CODER_AGENT_DESCRIPTION,
             system_message=system_prompt,
             model_client=coder_client,
-            tools=coder_tools,  # Includes memory RAG tools
+            tools=[_function_tool(tool) for tool in coder_tools],
             max_tool_iterations=300,  # High limit for long-running tasks
             reflect_on_tool_use=True,  # Show agent reasoning before tool calls
             model_context=coder_context,  # Limit context to prevent token overflow
@@ -561,7 +631,13 @@ class AgentOrchestrator:
             content_preview = ""
             if hasattr(last_message, "content"):
                 c = last_message.content
-                content_preview = str(c)[:120].replace("\n", " ") if c else "(empty)"
+                if not c:
+                    content_preview = "(empty)"
+                elif isinstance(c, list):
+                    # Tool calls/results: str() would render every item just to keep 120 chars
+                    content_preview = f"[list with {len(c)} items]"
+                else:
+                    content_preview = str(c)[:120].replace("\n", " ")
 
             # Enhanced logging with agent_id prefix
             self.logger.debug(
@@ -622,6 +698,14 @@ class AgentOrchestrator:
 
             # If the last message is from the User
             if last_message.source == "user":
+                if isinstance(last_message, TextMessage) and DIRECT_REQUEST_PATTERN.match(
+                    last_message.content
+                ):
+                    self.logger.debug(
+                        f"[{self.agent_id}] [Selector] Direct user request -> Starting with Coder"
+                    )
+                    return "Coder"
+
                 # Default to Planner for normal requests
                 self.logger.debug(
                     f"[{self.agent_id}] [Selector] User message -> Starting with Planner"
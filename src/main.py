@@ -3,6 +3,7 @@ Main file - Complete CLI interface for the code agent
 """
 
 import warnings
+from logging.handlers import QueueHandler
 
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="autogen.import_utils")
 warnings.filterwarnings(
@@ -19,7 +20,7 @@ import sys
 sys.path.insert(0, os.getcwd())
 
 # Import the orchestrator that handles all agent initialization
-from src.config.orchestrator import AgentOrchestrator
+from src.config.orchestrator import AgentOrchestrator, _get_base_tools, create_http_client
 from src.utils.errors import UserCancelledError
 
 
@@ -55,6 +56,8 @@ class DaveAgentCLI(AgentOrchestrator):
         )
 
         self.should_exit = False
+        # (content hash, ((model context, mark), ...)) of the mentioned files last sent
+        self._mentioned_files_sent = None
 
         t0 = time.time()
         # State management system (AutoGen save_state/load_state)
@@ -131,110 +134,12 @@ class DaveAgentCLI(AgentOrchestrator):
         # Start telemetry in background
         threading.Thread(target=init_telemetry_background, daemon=True).start()
 
-        t0 = time.time()
-        # Import all tools from the new structure
-        from src.tools import (
-            # Analysis
-            analyze_python_file,
-            csv_info,
-            csv_to_json,
-            delete_file,
-            edit_file,
-            file_search,
-            filter_csv,
-            find_function_definition,
-            format_json,
-            git_add,
-            git_branch,
-            git_commit,
-            git_diff,
-            git_log,
-            git_pull,
-            git_push,
-            # Git
-            git_status,
-            glob_search,
-            grep_search,
-            json_get_value,
-            json_set_value,
-            json_to_text,
-            list_all_functions,
-            list_dir,
-            merge_csv_files,
-            merge_json_files,
-            # CSV
-            read_csv,
-            # Filesystem
-            read_file,
-            # JSON
-            read_json,
-            run_terminal_cmd,
-            sort_csv,
-            validate_json,
-            web_search,
-            wiki_content,
-            wiki_page_info,
-            wiki_random,
-            # Web
-            wiki_search,
-            wiki_set_language,
-            wiki_summary,
-            write_csv,
-            write_file,
-            write_json,
-        )
-
         # Store all tools to filter them according to mode
-        self.all_tools = {
-            # READ-ONLY tools (available in both modes)
-            "read_only": [
-                read_file,
-                list_dir,
-                file_search,
-                glob_search,
-                git_status,
-                git_log,
-                git_branch,
-                git_diff,
-                read_json,
-                validate_json,
-                json_get_value,
-                json_to_text,
-                read_csv,
-                csv_info,
-                filter_csv,
-                wiki_search,
-                wiki_summary,
-                wiki_content,
-                wiki_page_info,
-                wiki_random,
-                wiki_set_language,
-                web_search,
-                analyze_python_file,
-                find_function_definition,
-                list_all_functions,
-                grep_search,
-            ],
-            # MODIFICATION tools (only in agent mode)
-            "modification": [
-                write_file,
-                edit_file,
-                delete_file,
-                git_add,
-                git_commit,
-                git_push,
-                git_pull,
-                write_json,
-                merge_json_files,
-                format_json,
-                json_set_value,
-                write_csv,
-                merge_csv_files,
-                csv_to_json,
-                sort_csv,
-                run_terminal_cmd,
-            ],
-        }
+        read_only, modification = _get_base_tools()
+        self.all_tools = {"read_only": list(read_only), "modification": list(modification)}
+
+        # Slash command dispatch table (see handle_command)
+        self._commands = self._build_command_table()
 
     # =========================================================================
     # COMMAND HANDLING
@@ -245,272 +150,269 @@ class DaveAgentCLI(AgentOrchestrator):
         parts = command.split(maxsplit=1)
         cmd = parts[0].lower()
 
-        if cmd in ["/exit", "/quit"]:
+        if cmd in ("/exit", "/quit"):
             return False
 
-        elif cmd == "/help":
-            self.cli.print_help()
+        handler = self._commands.get(cmd)
+        if handler is None:
+            self.cli.print_error(f"Unknown command: {cmd}")
+            self.cli.print_info("Use /help to see available commands")
+        else:
+            await handler(parts)
 
-        elif cmd == "/clear":
-            # Clear screen only - AutoGen handles history
-            self.cli.clear_screen()
-            self.cli.print_success("Screen cleared")
+        return True
 
-        elif cmd == "/new":
-            # Just clear screen - new session will be auto-created if needed
-            self.cli.clear_screen()
-            self.cli.print_success("New conversation started")
+    def _build_command_table(self) -> dict:
+        """
+        Map each slash command to an async handler taking the split command parts
 
-        elif cmd == "/new-session":
+        Built once per CLI so handle_command is a single dict lookup.
+        """
+        return {
+            "/help": self._help_command,
+            "/clear": self._clear_command,
+            "/new": self._new_command,
             # Create new session with metadata
-            await self._new_session_command(parts)
-
-        elif cmd == "/save-state" or cmd == "/save-session":
-            # Save complete state using AutoGen save_state
-            await self._save_state_command(parts)
-
-        elif cmd == "/load-state" or cmd == "/load-session":
-            # Load state using AutoGen load_state
-            await self._load_state_command(parts)
-
-        elif cmd == "/list-sessions" or cmd == "/sessions":
-            # List saved sessions with Rich table
-            await self._list_sessions_command()
-
-        elif cmd == "/history":
-            # Show current session history
-            await self._show_history_command(parts)
-
-        elif cmd == "/init":
+            "/new-session": self._new_session_command,
+            # Save/load complete state using AutoGen save_state/load_state
+            "/save-state": self._save_state_command,
+            "/save-session": self._save_state_command,
+            "/load-state": self._load_state_command,
+            "/load-session": self._load_state_command,
+            # REMOVED: /load command - Use /load-state instead (AutoGen official)
+            "/list-sessions": lambda _parts: self._list_sessions_command(),
+            "/sessions": lambda _parts: self._list_sessions_command(),
+            "/history": self._show_history_command,
             # Analyze the project and create a tailored DAVEAGENT.md file (Gemini-style)
-            await self._init_command()
-
-        # REMOVED: /load command - Use /load-state instead (AutoGen official)
-
-        elif cmd == "/debug":
-            # Change console handler level (file handler always stays at DEBUG)
-            console_handlers = [
-                h
-                for h in self.logger.logger.handlers
-                if isinstance(h, logging.Handler) and not isinstance(h, logging.FileHandler)
-            ]
-            current_console_level = console_handlers[0].level if console_handlers else logging.INFO
-            if current_console_level == logging.DEBUG:
-                for h in console_handlers:
-                    h.setLevel(logging.INFO)
-                self.cli.print_success("🔧 Debug mode DISABLED (console: INFO, file: DEBUG)")
-                self.logger.info("Console logging level changed to INFO")
-            else:
-                for h in console_handlers:
-                    h.setLevel(logging.DEBUG)
-                self.cli.print_success("🐛 Debug mode ENABLED (console: DEBUG, file: DEBUG)")
-                self.logger.debug("Console logging level changed to DEBUG")
-
-        elif cmd == "/logs":
-            # Show log file location
-            log_files = list(self.logger.logger.handlers)
-            file_handlers = [h for h in log_files if isinstance(h, logging.FileHandler)]
-            if file_handlers:
-                log_path = file_handlers[0].baseFilename
-                self.cli.print_info(f"📄 Log file: {log_path}")
-            else:
-                self.cli.print_info("No log files configured")
-
-        elif cmd == "/modo-agent":
-            # Switch to agent mode (with all tools)
-            if self.current_mode == "agent":
-                self.cli.print_info("Already in AGENT mode")
-            else:
-                self.current_mode = "agent"
-                self.cli.set_mode("agent")  # Update CLI display
-                await self._update_agent_tools_for_mode()
-                self.cli.print_success("🔧 AGENT mode enabled")
-                self.cli.print_info("✓ The agent can modify files and execute commands")
-
-        elif cmd == "/modo-chat":
-            # Switch to chat mode (read-only tools)
-            if self.current_mode == "chat":
-                self.cli.print_info("Already in CHAT mode")
-            else:
-                self.current_mode = "chat"
-                self.cli.set_mode("chat")  # Update CLI display
-                await self._update_agent_tools_for_mode()
-                self.cli.print_success("💬 CHAT mode enabled")
-                self.cli.print_info("✗ The agent CANNOT modify files or execute commands")
-                self.cli.print_info("ℹ️  Use /modo-agent to return to full mode")
-
-        elif cmd == "/config" or cmd == "/configuracion":
-            # Show current configuration
-            self.cli.print_info("\n⚙️  Current Configuration\n")
-            masked_key = (
-                f"{self.settings.api_key[:8]}...{self.settings.api_key[-4:]}"
-                if self.settings.api_key
-                else "Not configured"
-            )
-            self.cli.print_info(f"  • API Key: {masked_key}")
-            self.cli.print_info(f"  • Base URL: {self.settings.base_url}")
-            self.cli.print_info(f"  • Model: {self.settings.model}")
-            self.cli.print_info(f"  • SSL Verify: {self.settings.ssl_verify}")
-            self.cli.print_info(f"  • Mode: {self.current_mode.upper()}")
-            self.cli.print_info("\n💡 Available commands:")
-            self.cli.print_info("  • /set-model <model> - Change the model")
-            self.cli.print_info("  • /set-url <url> - Change the base URL")
-            self.cli.print_info("  • /set-ssl <true|false> - Change SSL verification")
-            self.cli.print_info("\n📄 Configuration file: .daveagent/.env")
-
-        elif cmd == "/set-model":
-            # Change the model
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /set-model <model-name>")
-                self.cli.print_info("\nExamples:")
-                self.cli.print_info("  /set-model deepseek-chat")
-                self.cli.print_info("  /set-model deepseek-reasoner")
-                self.cli.print_info("  /set-model gpt-4")
-            else:
-                new_model = parts[1]
-                old_model = self.settings.model
-                self.settings.model = new_model
-                # Update wrapped client's model (access through _wrapped)
-                if hasattr(self.model_client, "_wrapped"):
-                    self.model_client._wrapped._model = new_model
-                self.cli.print_success(f"✓ Model changed: {old_model} → {new_model}")
-                self.logger.info(f"Model changed from {old_model} to {new_model}")
-
-        elif cmd == "/set-url":
-            # Change the base URL
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /set-url <base-url>")
-                self.cli.print_info("\nExamples:")
-                self.cli.print_info("  /set-url https://api.deepseek.com")
-                self.cli.print_info("  /set-url https://api.openai.com/v1")
-            else:
-                new_url = parts[1]
-                old_url = self.settings.base_url
-                self.settings.base_url = new_url
-                # Update wrapped client's base URL (access through _wrapped)
-                if hasattr(self.model_client, "_wrapped"):
-                    self.model_client._wrapped._base_url = new_url
-                self.cli.print_success(f"✓ URL changed: {old_url} → {new_url}")
-                self.logger.info(f"Base URL changed from {old_url} to {new_url}")
-
-        elif cmd == "/set-ssl":
-            # Change SSL verification
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /set-ssl <true|false>")
-                self.cli.print_info("\nExamples:")
-                self.cli.print_info("  /set-ssl true   # Verify SSL certificates (default)")
-                self.cli.print_info("  /set-ssl false  # Disable SSL verification")
-                self.cli.print_warning("\n⚠️  Warning: Disabling SSL reduces security")
-            else:
-                ssl_value = parts[1].lower()
-                if ssl_value in ("true", "1", "yes", "on"):
-                    new_ssl = True
-                elif ssl_value in ("false", "0", "no", "off"):
-                    new_ssl = False
-                else:
-                    self.cli.print_error(f"Invalid value: {ssl_value}")
-                    self.cli.print_info("Use: true or false")
-                    return True
-
-                old_ssl = self.settings.ssl_verify
-                self.settings.ssl_verify = new_ssl
-
-                # Recreate HTTP client with new SSL configuration
-                import httpx
-
-                http_client = httpx.AsyncClient(verify=new_ssl)
+            "/init": lambda _parts: self._init_command(),
+            "/debug": self._debug_command,
+            "/logs": self._logs_command,
+            "/modo-agent": lambda _parts: self._switch_mode_command("agent"),
+            "/modo-chat": lambda _parts: self._switch_mode_command("chat"),
+            "/config": self._config_command,
+            "/configuracion": self._config_command,
+            "/set-model": self._set_model_command,
+            "/set-url": self._set_url_command,
+            "/set-ssl": self._set_ssl_command,
+            "/skills": lambda _parts: self._list_skills_command(),
+            "/skill-info": self._skill_info_command,
+            "/telemetry-off": lambda _parts: self._set_telemetry_command(False),
+            "/telemetry-on": lambda _parts: self._set_telemetry_command(True),
+            "/telemetry": self._telemetry_status_command,
+            "/subagents": lambda _parts: self._list_subagents_command(),
+            "/subagent-status": self._subagent_status_usage_command,
+            "/cron": self._cron_usage_command,
+        }
 
-                # Update model client (access through _wrapped)
-                if hasattr(self.model_client, "_wrapped"):
-                    # It's LoggingModelClientWrapper, update wrapped client
-                    self.model_client._wrapped._http_client = http_client
+    async def _help_command(self, parts: list):
+        """Command /help"""
+        self.cli.print_help()
+
+    async def _clear_command(self, parts: list):
+        """Command /clear: clear screen only - AutoGen handles history"""
+        self.cli.clear_screen()
+        self.cli.print_success("Screen cleared")
+
+    async def _new_command(self, parts: list):
+        """Command /new: just clear screen - new session will be auto-created if needed"""
+        self.cli.clear_screen()
+        self.cli.print_success("New conversation started")
+
+    async def _debug_command(self, parts: list):
+        """Command /debug: change console handler level (file handler always stays at DEBUG)"""
+        console_handlers = [
+            h
+            for h in self.logger.logger.handlers
+            if isinstance(h, logging.Handler)
+            and not isinstance(h, (logging.FileHandler, QueueHandler))
+        ]
+        current_console_level = console_handlers[0].level if console_handlers else logging.INFO
+        if current_console_level == logging.DEBUG:
+            for h in console_handlers:
+                h.setLevel(logging.INFO)
+            self.cli.print_success("🔧 Debug mode DISABLED (console: INFO, file: DEBUG)")
+            self.logger.info("Console logging level changed to INFO")
+        else:
+            for h in console_handlers:
+                h.setLevel(logging.DEBUG)
+            self.cli.print_success("🐛 Debug mode ENABLED (console: DEBUG, file: DEBUG)")
+            self.logger.debug("Console logging level changed to DEBUG")
+
+    async def _logs_command(self, parts: list):
+        """Command /logs: show log file location"""
+        file_handler = self.logger.file_handler
+        if file_handler is not None:
+            log_path = file_handler.baseFilename
+            self.cli.print_info(f"📄 Log file: {log_path}")
+        else:
+            self.cli.print_info("No log files configured")
 
-                self.cli.print_success(f"✓ SSL Verify changed: {old_ssl} → {new_ssl}")
-                if not new_ssl:
-                    self.cli.print_warning(
-                        "⚠️  SSL verification disabled - Connections are not secure"
-                    )
-                self.logger.info(f"SSL verify changed from {old_ssl} to {new_ssl}")
+    async def _switch_mode_command(self, mode: str):
+        """Commands /modo-agent and /modo-chat: switch mode and rebuild the agents"""
+        if self.current_mode == mode:
+            self.cli.print_info(f"Already in {mode.upper()} mode")
+            return
 
-        elif cmd == "/skills":
-            # List available agent skills
-            await self._list_skills_command()
+        self.current_mode = mode
+        self.cli.set_mode(mode)  # Update CLI display
+        await self._update_agent_tools_for_mode()
+        if mode == "agent":
+            # Agent mode (with all tools)
+            self.cli.print_success("🔧 AGENT mode enabled")
+            self.cli.print_info("✓ The agent can modify files and execute commands")
+        else:
+            # Chat mode (read-only tools)
+            self.cli.print_success("💬 CHAT mode enabled")
+            self.cli.print_info("✗ The agent CANNOT modify files or execute commands")
+            self.cli.print_info("ℹ️  Use /modo-agent to return to full mode")
+
+    async def _config_command(self, parts: list):
+        """Command /config: show current configuration"""
+        self.cli.print_info("\n⚙️  Current Configuration\n")
+        masked_key = (
+            f"{self.settings.api_key[:8]}...{self.settings.api_key[-4:]}"
+            if self.settings.api_key
+            else "Not configured"
+        )
+        self.cli.print_info(f"  • API Key: {masked_key}")
+        self.cli.print_info(f"  • Base URL: {self.settings.base_url}")
+        self.cli.print_info(f"  • Model: {self.settings.model}")
+        self.cli.print_info(f"  • SSL Verify: {self.settings.ssl_verify}")
+        self.cli.print_info(f"  • Mode: {self.current_mode.upper()}")
+        self.cli.print_info("\n💡 Available commands:")
+        self.cli.print_info("  • /set-model <model> - Change the model")
+        self.cli.print_info("  • /set-url <url> - Change the base URL")
+        self.cli.print_info("  • /set-ssl <true|false> - Change SSL verification")
+        self.cli.print_info("\n📄 Configuration file: .daveagent/.env")
+
+    async def _set_model_command(self, parts: list):
+        """Command /set-model <model>: change the model"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /set-model <model-name>")
+            self.cli.print_info("\nExamples:")
+            self.cli.print_info("  /set-model deepseek-chat")
+            self.cli.print_info("  /set-model deepseek-reasoner")
+            self.cli.print_info("  /set-model gpt-4")
+            return
 
-        elif cmd == "/skill-info":
-            # Show skill details
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /skill-info <skill-name>")
-                self.cli.print_info("Use /skills to see available skills")
-            else:
-                await self._show_skill_info_command(parts[1])
+        new_model = parts[1]
+        old_model = self.settings.model
+        self.settings.model = new_model
+        # Update wrapped client's model (access through _wrapped)
+        if hasattr(self.model_client, "_wrapped"):
+            self.model_client._wrapped._model = new_model
+        self.cli.print_success(f"✓ Model changed: {old_model} → {new_model}")
+        self.logger.info(f"Model changed from {old_model} to {new_model}")
+
+    async def _set_url_command(self, parts: list):
+        """Command /set-url <url>: change the base URL"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /set-url <base-url>")
+            self.cli.print_info("\nExamples:")
+            self.cli.print_info("  /set-url https://api.deepseek.com")
+            self.cli.print_info("  /set-url https://api.openai.com/v1")
+            return
 
-        elif cmd == "/telemetry-off":
-            # Disable telemetry
-            from src.config import is_telemetry_enabled, set_telemetry_enabled
+        new_url = parts[1]
+        old_url = self.settings.base_url
+        self.settings.base_url = new_url
+        # Update wrapped client's base URL (access through _wrapped)
+        if hasattr(self.model_client, "_wrapped"):
+            self.model_client._wrapped._base_url = new_url
+        self.cli.print_success(f"✓ URL changed: {old_url} → {new_url}")
+        self.logger.info(f"Base URL changed from {old_url} to {new_url}")
+
+    async def _set_ssl_command(self, parts: list):
+        """Command /set-ssl <true|false>: change SSL verification"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /set-ssl <true|false>")
+            self.cli.print_info("\nExamples:")
+            self.cli.print_info("  /set-ssl true   # Verify SSL certificates (default)")
+            self.cli.print_info("  /set-ssl false  # Disable SSL verification")
+            self.cli.print_warning("\n⚠️  Warning: Disabling SSL reduces security")
+            return
 
-            if not is_telemetry_enabled():
-                self.cli.print_info("📊 Telemetry is already disabled")
-            else:
-                set_telemetry_enabled(False)
-                self.cli.print_success("📊 Telemetry disabled")
-                self.cli.print_info("ℹ️  Changes will take effect on next restart")
+        ssl_value = parts[1].lower()
+        if ssl_value in ("true", "1", "yes", "on"):
+            new_ssl = True
+        elif ssl_value in ("false", "0", "no", "off"):
+            new_ssl = False
+        else:
+            self.cli.print_error(f"Invalid value: {ssl_value}")
+            self.cli.print_info("Use: true or false")
+            return
 
-        elif cmd == "/telemetry-on":
-            # Enable telemetry
-            from src.config import is_telemetry_enabled, set_telemetry_enabled
+        old_ssl = self.settings.ssl_verify
+        self.settings.ssl_verify = new_ssl
 
-            if is_telemetry_enabled():
-                self.cli.print_info("📊 Telemetry is already enabled")
-            else:
-                set_telemetry_enabled(True)
-                self.cli.print_success("📊 Telemetry enabled")
-                self.cli.print_info("ℹ️  Changes will take effect on next restart")
-
-        elif cmd == "/telemetry":
-            # Show telemetry status
-            from src.config import is_telemetry_enabled
-
-            status = "enabled" if is_telemetry_enabled() else "disabled"
-            runtime = "active" if self.langfuse_enabled else "inactive"
-            self.cli.print_info(f"📊 Telemetry status: {status}")
-            self.cli.print_info(f"📊 Runtime status: {runtime}")
-            if not is_telemetry_enabled():
-                self.cli.print_info("ℹ️  Use /telemetry-on to enable telemetry")
-            else:
-                self.cli.print_info("ℹ️  Use /telemetry-off to disable telemetry")
+        # Recreate HTTP client with new SSL configuration
+        http_client = create_http_client(new_ssl)
 
-        elif cmd == "/subagents":
-            # List active subagents
-            await self._list_subagents_command()
+        # Update model client (access through _wrapped)
+        if hasattr(self.model_client, "_wrapped"):
+            # It's LoggingModelClientWrapper, update wrapped client
+            self.model_client._wrapped._http_client = http_client
+
+        self.cli.print_success(f"✓ SSL Verify changed: {old_ssl} → {new_ssl}")
+        if not new_ssl:
+            self.cli.print_warning("⚠️  SSL verification disabled - Connections are not secure")
+        self.logger.info(f"SSL verify changed from {old_ssl} to {new_ssl}")
+
+    async def _skill_info_command(self, parts: list):
+        """Command /skill-info <skill-name>: show skill details"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /skill-info <skill-name>")
+            self.cli.print_info("Use /skills to see available skills")
+        else:
+            await self._show_skill_info_command(parts[1])
 
-        elif cmd == "/subagent-status":
-            # Show status of specific subagent
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /subagent-status <subagent-id>")
-                self.cli.print_info("Use /subagents to see active subagents")
-            else:
-                await self._subagent_status_command(parts[1])
+    async def _set_telemetry_command(self, enabled: bool):
+        """Commands /telemetry-on and /telemetry-off"""
+        from src.config import is_telemetry_enabled, set_telemetry_enabled
 
-        elif cmd == "/cron":
-            # Cron management commands
-            if len(parts) < 2:
-                self.cli.print_error("Usage: /cron <add|list|enable|disable|remove|run>")
-                self.cli.print_info("Examples:")
-                self.cli.print_info("  /cron add at 2026-02-20T15:30 Review PRs")
-                self.cli.print_info("  /cron add every 1h Check build status")
-                self.cli.print_info("  /cron add cron '0 9 * * *' Daily standup")
-                self.cli.print_info("  /cron list")
-                self.cli.print_info("  /cron enable <job-id>")
-                self.cli.print_info("  /cron run <job-id>")
-            else:
-                subcmd = parts[1]
-                await self._cron_command(subcmd, parts[2:])
+        state = "enabled" if enabled else "disabled"
+        if is_telemetry_enabled() == enabled:
+            self.cli.print_info(f"📊 Telemetry is already {state}")
+        else:
+            set_telemetry_enabled(enabled)
+            self.cli.print_success(f"📊 Telemetry {state}")
+            self.cli.print_info("ℹ️  Changes will take effect on next restart")
+
+    async def _telemetry_status_command(self, parts: list):
+        """Command /telemetry: show telemetry status"""
+        from src.config import is_telemetry_enabled
+
+        status = "enabled" if is_telemetry_enabled() else "disabled"
+        runtime = "active" if self.langfuse_enabled else "inactive"
+        self.cli.print_info(f"📊 Telemetry status: {status}")
+        self.cli.print_info(f"📊 Runtime status: {runtime}")
+        if not is_telemetry_enabled():
+            self.cli.print_info("ℹ️  Use /telemetry-on to enable telemetry")
+        else:
+            self.cli.print_info("ℹ️  Use /telemetry-off to disable telemetry")
 
+    async def _subagent_status_usage_command(self, parts: list):
+        """Command /subagent-status <subagent-id>: show status of specific subagent"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /subagent-status <subagent-id>")
+            self.cli.print_info("Use /subagents to see active subagents")
         else:
-            self.cli.print_error(f"Unknown command: {cmd}")
-            self.cli.print_info("Use /help to see available commands")
+            await self._subagent_status_command(parts[1])
 
-        return True
+    async def _cron_usage_command(self, parts: list):
+        """Command /cron <subcommand>: cron management commands"""
+        if len(parts) < 2:
+            self.cli.print_error("Usage: /cron <add|list|enable|disable|remove|run>")
+            self.cli.print_info("Examples:")
+            self.cli.print_info("  /cron add at 2026-02-20T15:30 Review PRs")
+            self.cli.print_info("  /cron add every 1h Check build status")
+            self.cli.print_info("  /cron add cron '0 9 * * *' Daily standup")
+            self.cli.print_info("  /cron list")
+            self.cli.print_info("  /cron enable <job-id>")
+            self.cli.print_info("  /cron run <job-id>")
+        else:
+            subcmd = parts[1]
+            await self._cron_command(subcmd, parts[2:])
 
     # =========================================================================
     # PROJECT INIT - Analyze project and generate DAVEAGENT.md (Gemini-style)
@@ -939,6 +841,8 @@ TITLE:"""
             team_loaded = await self.state_manager.load_team_state(
                 self.main_team, self.client_strong
             )
+            # The loaded history may not contain the mentioned files
+            self._mentioned_files_sent = None
 
             self.cli.stop_thinking()
 
@@ -1536,6 +1440,41 @@ TITLE:"""
             print("\n⚠️  Forcing exit...")
             self.should_exit = True
 
+    def _get_mentioned_files_context(self) -> str:
+        """
+        Mentioned files content for the next request, sent again only when needed
+
+        The team keeps its history between requests, so resending unchanged files
+        would duplicate them in context. While the request that carried them is
+        still in every agent's window, a one-line reference is sent instead.
+        """
+        content = self.cli.get_mentioned_files_content()
+        contexts = (self.coder_agent._model_context, self.planning_agent._model_context)
+
+        sent = self._mentioned_files_sent
+        if (
+            sent is not None
+            and sent[0] == hash(content)
+            and tuple(context for context, _ in sent[1]) == contexts
+            and all(context.in_window(mark) for context, mark in sent[1])
+        ):
+            self.logger.debug("📎 Mentioned files unchanged and still in context, not resending")
+            files = ", ".join(str(f) for f in self.cli.mentioned_files)
+            return f"📎 Mentioned files (content sent earlier, unchanged): {files}\n"
+
+        from src.utils import ChunkedChatCompletionContext
+
+        # Only chunked contexts can tell whether the content is still in their window
+        if all(isinstance(context, ChunkedChatCompletionContext) for context in contexts):
+            marks = tuple((context, context.mark()) for context in contexts)
+            self._mentioned_files_sent = (hash(content), marks)
+        else:
+            self._mentioned_files_sent = None
+        self.logger.info(
+            f"📎 Including {len(self.cli.mentioned_files)} mentioned file(s) in context"
+        )
+        return content
+
     async def process_user_request(self, user_input: str):
         """
         Process a user request using the single ROUTER TEAM.
@@ -1570,10 +1509,7 @@ TITLE:"""
             mentioned_files_content = ""
             if self.cli.mentioned_files:
                 self.cli.print_mentioned_files()
-                mentioned_files_content = self.cli.get_mentioned_files_content()
-                self.logger.info(
-                    f"📎 Including {len(self.cli.mentioned_files)} mentioned file(s) in context"
-                )
+                mentioned_files_content = self._get_mentioned_files_context()
 
             # =================================================================
             # DYNAMIC SKILL RAG INJECTION (SEMANTIC THRESHOLD-BASED)
@@ -1682,12 +1618,6 @@ TITLE:"""
                         f"Preview: {content_preview}"
                     )
 
-                    # LOG FULL MESSAGE CONTENT for important types (helps debug missing messages)
-                    if msg_type in ["TextMessage", "ThoughtEvent"]:
-                        full_content = ""
-                        if hasattr(msg, "content"):
-                            full_content = str(msg.content)
-
                     # Only process messages that are NOT from the user
                     # UPDATED: Also process messages without source (fallback)
                     should_process = False
@@ -2249,8 +2179,10 @@ TITLE:"""
                 # Ensure spinner is stopped
                 self.cli.stop_thinking()
 
-                # Log interaction to JSON
-                self._log_interaction_to_json(
+                # Log interaction to JSON (rewrites the whole history file, so
+                # keep it off the event loop)
+                await asyncio.to_thread(
+                    self._log_interaction_to_json,
                     user_input=user_input,
                     agent_responses=all_agent_responses,
                     agents_used=agents_used,
@@ -2329,11 +2261,11 @@ TITLE:"""
 
                 # Emergency fallback: Reset agent contexts to smaller buffer
                 try:
-                    from autogen_core.model_context import BufferedChatCompletionContext
+                    from src.utils import ChunkedChatCompletionContext
 
                     # Reduce buffer size dramatically for emergency recovery
-                    self.coder_agent._model_context = BufferedChatCompletionContext(buffer_size=30)
-                    self.planning_agent._model_context = BufferedChatCompletionContext(
+                    self.coder_agent._model_context = ChunkedChatCompletionContext(buffer_size=30)
+                    self.planning_agent._model_context = ChunkedChatCompletionContext(
                         buffer_size=30
                     )
 
@@ -2387,12 +2319,10 @@ TITLE:"""
 
             self.logger.log_error_with_context(e, "process_user_request")
             self.cli.print_error(f"Error processing request: {str(e)}")
+            # log_error_with_context already logged the full traceback
             import traceback
 
-            error_traceback = traceback.format_exc()
-            self.logger.error(f"Full traceback:\n{error_traceback}")
-            self.logger.error(f"Full traceback:\n{error_traceback}")
-            self.cli.print_error(f"Details:\n{error_traceback}")
+            self.cli.print_error(f"Details:\n{traceback.format_exc()}")
 
             # Save state even on error
             await self._auto_save_agent_states()
@@ -2417,8 +2347,6 @@ TITLE:"""
         """
         import asyncio
 
-        import httpx
-
         from src.utils.setup_wizard import run_interactive_setup
 
         # Run setup wizard in executor to avoid blocking the event loop
@@ -2435,7 +2363,7 @@ TITLE:"""
             self.settings.strong_model = model
 
         # Rebuild HTTP client
-        http_client = httpx.AsyncClient(verify=self.settings.ssl_verify)
+        http_client = create_http_client(self.settings.ssl_verify)
 
         # Rebuild model clients with new credentials
         from autogen_ext.models.openai import OpenAIChatCompletionClient
@@ -2777,6 +2705,23 @@ async def main(
     await app.run(initial_prompt=prompt)
 
 
+def run_event_loop(coro):
+    """
+    Run the top-level coroutine, on uvloop when it is installed
+
+    uvloop is an optional speedup (pip install daveagent-cli[speedups]; not
+    available on Windows). Without it the default asyncio loop is used.
+    uvloop.run creates the loop directly, without touching the global
+    event loop policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    return uvloop.run(coro)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -2786,4 +2731,4 @@ if __name__ == "__main__":
     if debug_mode:
         print("🐛 DEBUG mode enabled")
 
-    asyncio.run(main(debug=debug_mode))
+    run_event_loop(main(debug=debug_mode))
@@ -12,6 +12,31 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _read_json(path: Path) -> Any:
+    """Read a session/report JSON file (bytes in, so the encoding is always UTF-8)"""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, stringifying unknown types like json's default=str"""
+    if orjson is not None:
+        payload = orjson.dumps(
+            data,
+            default=str,
+            # Match json.dump(default=str): datetimes via str(), int keys as strings
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    else:
+        payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+    path.write_bytes(payload)
+
 
 class StateManager:
     """
@@ -122,8 +147,7 @@ class StateManager:
 
         for state_file in self.state_dir.glob("session_*.json"):
             try:
-                with open(state_file) as f:
-                    data = json.load(f)
+                data = _read_json(state_file)
 
                 # Extract session metadata
                 metadata = data.get("session_metadata", {})
@@ -324,8 +348,7 @@ class StateManager:
                 }
 
             # Write to file
-            with open(state_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            _write_json(state_path, data)
 
             self.last_save_time = datetime.now()
             self.logger.info(f"💾 State saved to: {state_path}")
@@ -354,8 +377,7 @@ class StateManager:
             return False
 
         try:
-            with open(state_path) as f:
-                data = json.load(f)
+            data = _read_json(state_path)
 
             self._agent_states = data.get("agent_states", {})
             self._team_states = data.get("team_states", {})
@@ -509,8 +531,7 @@ class StateManager:
                 if not state_path.exists():
                     return []
 
-                with open(state_path) as f:
-                    data = json.load(f)
+                data = _read_json(state_path)
                 agent_states = data.get("agent_states", {})
 
             # Extract all messages from all agents
@@ -557,8 +578,7 @@ class StateManager:
             if not state_path.exists():
                 return {}
 
-            with open(state_path) as f:
-                data = json.load(f)
+            data = _read_json(state_path)
 
             return data.get("session_metadata", {})
 
@@ -605,8 +625,7 @@ class StateManager:
                 if not state_path.exists():
                     return []
 
-                with open(state_path) as f:
-                    data = json.load(f)
+                data = _read_json(state_path)
                 agent_states = data.get("agent_states", {})
                 team_states = data.get("team_states", {})
 
@@ -822,8 +841,7 @@ class StateManager:
         }
 
         # Save report
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        _write_json(Path(output_path), report)
 
         self.logger.info(f"📊 Tool reflection report saved to: {output_path}")
         return output_path
@@ -1,9 +1,10 @@
+import asyncio
 import glob
 import logging
 import os
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.tools.common import EXCLUDED_DIRS, get_workspace
 
@@ -13,8 +14,9 @@ logger = logging.getLogger(__name__)
 RECENCY_THRESHOLD_SECONDS = 24 * 60 * 60  # 24 hours
 MAX_RESULTS_LIMIT = 200  # Safety limit for context window
 
-# Optional import for pathspec
-import pathspec
+# pathspec is imported where .gitignore is parsed, keeping it off the startup path
+if TYPE_CHECKING:
+    import pathspec
 
 WORKSPACE = Path(os.getcwd()).resolve()
 
@@ -23,6 +25,8 @@ def _load_gitignore_patterns(root_path: Path) -> Optional["pathspec.PathSpec"]:
     gitignore = root_path / ".gitignore"
     if gitignore.exists():
         try:
+            import pathspec
+
             with open(gitignore, encoding="utf-8") as f:
                 return pathspec.PathSpec.from_lines("gitwildmatch", f)
         except Exception:
@@ -117,7 +121,8 @@ async def glob_search(
 
         # Execute glob
         # recursive=True allows '**' logic
-        files = glob.glob(full_pattern, recursive=True)
+        # (in a thread: a '**' walk over a large tree would block the event loop)
+        files = await asyncio.to_thread(glob.glob, full_pattern, recursive=True)
 
         # Filter files and ignores
         path_entries = []
@@ -2,6 +2,7 @@
 GREP Search Tool (Git Grep + Python Fallback)
 """
 
+import asyncio
 import re
 import shutil
 import subprocess
@@ -160,7 +161,21 @@ async def grep_search(
         explanation: Optional description of why this search is being performed (shown in terminal)
     """
     workspace = get_workspace()
+    # git grep and the Python walk both block; run them off the event loop so
+    # parallel tool calls from the agent actually overlap
+    return await asyncio.to_thread(
+        _grep_search_sync, query, workspace, case_sensitive, include_pattern, exclude_pattern
+    )
 
+
+def _grep_search_sync(
+    query: str,
+    workspace: Path,
+    case_sensitive: bool,
+    include_pattern: str | None,
+    exclude_pattern: str | None,
+) -> str:
+    """Blocking body of grep_search (git grep, then the Python fallback)."""
     # 1. Try Git Grep (Fast Strategy)
     # Only if we're in a git repo and there are no complex exclusion patterns
     # (git grep uses .gitignore, which is usually what we want)
@@ -6,6 +6,22 @@ import json
 import logging
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # json also accepts NaN/Infinity and produces the usual error messages
+            pass
+    return json.loads(text)
+
 
 async def read_json(filepath: str, encoding: str = "utf-8") -> dict[str, Any] | list[Any]:
     """
@@ -20,7 +36,7 @@ async def read_json(filepath: str, encoding: str = "utf-8") -> dict[str, Any] |
     """
     try:
         with open(filepath, encoding=encoding) as f:
-            data = json.load(f)
+            data = _loads(f.read())
         return data
     except Exception as e:
         error_msg = f"Error reading JSON file {filepath}: {str(e)}"
@@ -119,7 +135,7 @@ async def validate_json(filepath: str) -> str:
     """
     try:
         with open(filepath, encoding="utf-8") as f:
-            json.load(f)
+            _loads(f.read())
         return f"✓ {filepath} is a valid JSON"
     except json.JSONDecodeError as e:
         return f"ERROR: Invalid JSON in {filepath}: {str(e)}"
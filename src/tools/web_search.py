@@ -2,13 +2,13 @@
 Web Search Tool - Real-time web search using DuckDuckGo
 """
 
+import asyncio
 import logging
 import random
 import time
 from urllib.parse import quote_plus
 
 import requests
-from bs4 import BeautifulSoup
 
 
 async def web_search(search_term: str, explanation: str = "", max_results: int = 5) -> str:
@@ -41,22 +41,27 @@ async def web_search(search_term: str, explanation: str = "", max_results: int =
             "Connection": "keep-alive",
         }
 
-        # Try DuckDuckGo first (more scraping-friendly)
-        try:
-            results.extend(_search_duckduckgo(search_term, headers, max_results // 2))
-        except Exception as e:
-            print(f"DuckDuckGo search failed: {e}")
-
-        # Try Bing as backup
-        try:
-            results.extend(_search_bing(search_term, headers, max_results // 2))
-        except Exception as e:
-            print(f"Bing search failed: {e}")
+        # Query DuckDuckGo and Bing (backup) concurrently; requests blocks, so
+        # each engine runs in a worker thread
+        engine_results = await asyncio.gather(
+            asyncio.to_thread(_search_duckduckgo, search_term, headers, max_results // 2),
+            asyncio.to_thread(_search_bing, search_term, headers, max_results // 2),
+            return_exceptions=True,
+        )
+        for engine, engine_result in zip(("DuckDuckGo", "Bing"), engine_results, strict=True):
+            if isinstance(engine_result, Exception):
+                print(f"{engine} search failed: {engine_result}")
+            else:
+                results.extend(engine_result)
 
         # If no results, try a simple Google search (be cautious with rate limiting)
         if not results:
             try:
-                results.extend(_search_google_simple(search_term, headers, max_results))
+                results.extend(
+                    await asyncio.to_thread(
+                        _search_google_simple, search_term, headers, max_results
+                    )
+                )
             except Exception as e:
                 print(f"Google search failed: {e}")
 
@@ -88,6 +93,8 @@ def _search_duckduckgo(query: str, headers: dict, max_results: int) -> list[dict
     response = requests.get(url, headers=headers, timeout=10)
     response.raise_for_status()
 
+    from bs4 import BeautifulSoup  # deferred: only needed once a search runs
+
     soup = BeautifulSoup(response.content, "html.parser")
 
     # Find search results
@@ -122,6 +129,8 @@ def _search_bing(query: str, headers: dict, max_results: int) -> list[dict]:
     response = requests.get(url, headers=headers, timeout=10)
     response.raise_for_status()
 
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(response.content, "html.parser")
 
     # Find search results
@@ -163,6 +172,8 @@ def _search_google_simple(query: str, headers: dict, max_results: int) -> list[d
     response = requests.get(url, headers=headers, timeout=10)
     response.raise_for_status()
 
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(response.content, "html.parser")
 
     # Find search results (Google's structure changes frequently)
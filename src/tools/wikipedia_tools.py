@@ -2,6 +2,7 @@
 Wikipedia Tools for AutoGen - Wikipedia search and content access
 """
 
+import asyncio
 import logging
 from importlib import util
 
@@ -16,6 +17,46 @@ def _check_wikipedia():
     return wikipedia
 
 
+# The wikipedia package does blocking HTTP (page properties like .content and
+# .links load lazily), so the tools below run it in worker threads.
+
+
+def _page_content(wikipedia, title: str, max_chars: int) -> str:
+    """Fetch a page and format its full content (blocking)."""
+    page = wikipedia.page(title, auto_suggest=True)
+
+    content = f"=== {page.title} ===\n"
+    content += f"URL: {page.url}\n\n"
+    content += page.content
+
+    # Limit characters if necessary
+    if len(content) > max_chars:
+        content = content[:max_chars] + "\n\n... (content truncated)"
+
+    return content
+
+
+def _page_info(wikipedia, title: str) -> str:
+    """Fetch a page and format its summary, categories and links (blocking)."""
+    page = wikipedia.page(title, auto_suggest=True)
+
+    output = f"=== Information for: {page.title} ===\n\n"
+    output += f"URL: {page.url}\n"
+    output += f"Summary: {page.summary[:300]}...\n\n"
+    output += f"Categories ({len(page.categories)}):\n"
+    for cat in page.categories[:10]:
+        output += f"  - {cat}\n"
+
+    output += f"\nRelated links ({len(page.links)}):\n"
+    for link in page.links[:10]:
+        output += f"  - {link}\n"
+
+    output += f"\nReferences: {len(page.references)} links\n"
+    output += f"Images: {len(page.images)} images\n"
+
+    return output
+
+
 async def wiki_search(query: str, max_results: int = 10) -> str:
     """
     Searches Wikipedia and returns related page titles.
@@ -29,7 +70,9 @@ async def wiki_search(query: str, max_results: int = 10) -> str:
     """
     try:
         wikipedia = _check_wikipedia()
-        search_results = wikipedia.search(query, results=max_results, suggestion=True)
+        search_results = await asyncio.to_thread(
+            wikipedia.search, query, results=max_results, suggestion=True
+        )
 
         if isinstance(search_results, tuple):
             results, suggestion = search_results
@@ -64,7 +107,9 @@ async def wiki_summary(title: str, sentences: int = 5) -> str:
     """
     try:
         wikipedia = _check_wikipedia()
-        summary = wikipedia.summary(title, sentences=sentences, auto_suggest=True)
+        summary = await asyncio.to_thread(
+            wikipedia.summary, title, sentences=sentences, auto_suggest=True
+        )
         return f"=== {title} ===\n\n{summary}"
 
     except wikipedia.exceptions.DisambiguationError as e:
@@ -96,17 +141,7 @@ async def wiki_content(title: str, max_chars: int = 5000) -> str:
     """
     try:
         wikipedia = _check_wikipedia()
-        page = wikipedia.page(title, auto_suggest=True)
-
-        content = f"=== {page.title} ===\n"
-        content += f"URL: {page.url}\n\n"
-        content += page.content
-
-        # Limit characters if necessary
-        if len(content) > max_chars:
-            content = content[:max_chars] + "\n\n... (content truncated)"
-
-        return content
+        return await asyncio.to_thread(_page_content, wikipedia, title, max_chars)
 
     except wikipedia.exceptions.DisambiguationError as e:
         options = e.options[:10]
@@ -136,23 +171,7 @@ async def wiki_page_info(title: str) -> str:
     """
     try:
         wikipedia = _check_wikipedia()
-        page = wikipedia.page(title, auto_suggest=True)
-
-        output = f"=== Information for: {page.title} ===\n\n"
-        output += f"URL: {page.url}\n"
-        output += f"Summary: {page.summary[:300]}...\n\n"
-        output += f"Categories ({len(page.categories)}):\n"
-        for cat in page.categories[:10]:
-            output += f"  - {cat}\n"
-
-        output += f"\nRelated links ({len(page.links)}):\n"
-        for link in page.links[:10]:
-            output += f"  - {link}\n"
-
-        output += f"\nReferences: {len(page.references)} links\n"
-        output += f"Images: {len(page.images)} images\n"
-
-        return output
+        return await asyncio.to_thread(_page_info, wikipedia, title)
 
     except wikipedia.exceptions.DisambiguationError as e:
         options = e.options[:10]
@@ -184,10 +203,10 @@ async def wiki_random(count: int = 1) -> str:
         wikipedia = _check_wikipedia()
 
         if count == 1:
-            random_title = wikipedia.random()
+            random_title = await asyncio.to_thread(wikipedia.random)
             return f"Random page: {random_title}"
         else:
-            random_titles = wikipedia.random(count)
+            random_titles = await asyncio.to_thread(wikipedia.random, count)
             output = f"Random pages ({count}):\n\n"
             for i, title in enumerate(random_titles, 1):
                 output += f"{i}. {title}\n"
@@ -1,5 +1,6 @@
 """Utilidades del sistema"""
 
+from .chunked_model_context import ChunkedChatCompletionContext
 from .conversation_tracker import ConversationTracker, get_conversation_tracker
 from .deepseek_reasoning_client import DeepSeekReasoningClient
 from .file_indexer import FileIndexer
@@ -26,6 +27,7 @@ __all__ = [
     "select_file_interactive",
     "VibeSpinner",
     "show_vibe_spinner",
+    "ChunkedChatCompletionContext",
     "ConversationTracker",
     "get_conversation_tracker",
     "HistoryViewer",
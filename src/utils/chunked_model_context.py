@@ -0,0 +1,75 @@
+"""
+Chunked chat completion context - a history window that stays prefix-stable
+
+BufferedChatCompletionContext slides by one message per call once the history
+is longer than its buffer, so the prompt after the system message changes on
+every request and the provider's prefix cache never hits. This context keeps
+the start of the window fixed and only moves it, in one jump, when the window
+outgrows the buffer.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from autogen_core.model_context import BufferedChatCompletionContext
+from autogen_core.models import FunctionExecutionResultMessage, LLMMessage
+
+
+class ChunkedChatCompletionContext(BufferedChatCompletionContext):
+    """
+    Append-only view of the last messages, reset in chunks
+
+    The view grows until it holds more than buffer_size messages, then restarts
+    at the newest buffer_size // 2 messages. It never holds more than
+    buffer_size messages, like BufferedChatCompletionContext, but between two
+    resets every request extends the previous prompt instead of shifting it.
+
+    Args:
+        buffer_size: Maximum number of messages in the view
+        initial_messages: Initial messages
+    """
+
+    component_provider_override = "src.utils.chunked_model_context.ChunkedChatCompletionContext"
+
+    def __init__(self, buffer_size: int, initial_messages: list[LLMMessage] | None = None) -> None:
+        super().__init__(buffer_size, initial_messages)
+        self._window_start = 0
+        # Bumped whenever the messages are replaced, so old marks stop matching
+        self._generation = 0
+
+    def _current_window_start(self) -> int:
+        """Window start for the messages held now, applying a pending reset"""
+        if len(self._messages) - self._window_start > self._buffer_size:
+            return len(self._messages) - self._buffer_size // 2
+        return self._window_start
+
+    def mark(self) -> tuple[int, int]:
+        """Position the next added message will take, for a later in_window() check"""
+        return (self._generation, len(self._messages))
+
+    def in_window(self, mark: tuple[int, int]) -> bool:
+        """Whether messages added from mark on are still in the current window"""
+        generation, position = mark
+        return generation == self._generation and position >= self._current_window_start()
+
+    async def get_messages(self) -> list[LLMMessage]:
+        """Get the messages from the current window start"""
+        self._window_start = self._current_window_start()
+
+        messages = self._messages[self._window_start :]
+        # A tool result without its tool call is rejected by the API
+        if messages and isinstance(messages[0], FunctionExecutionResultMessage):
+            messages = messages[1:]
+        return messages
+
+    async def clear(self) -> None:
+        """Clear the context and the window"""
+        await super().clear()
+        self._window_start = 0
+        self._generation += 1
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        """Load messages and start a new window over them"""
+        await super().load_state(state)
+        self._window_start = 0
+        self._generation += 1
@@ -413,11 +413,7 @@ async def compress_context_if_needed(
         ...     state=state
         ... )
     """
-    from src.utils.token_counter import (
-        count_message_tokens,
-        get_model_context_limit,
-        should_compress_context,
-    )
+    from src.utils.token_counter import count_message_tokens, get_model_context_limit
 
     # Create default state if not provided
     if state is None:
@@ -428,8 +424,9 @@ async def compress_context_if_needed(
     max_tokens = get_model_context_limit(model)
     usage_ratio = current_tokens / max_tokens
 
-    # Check if compression is needed
-    if not should_compress_context(messages, model, state.compression_threshold):
+    # Check if compression is needed (same test as should_compress_context,
+    # without counting the messages a second time)
+    if usage_ratio < state.compression_threshold:
         # Log context stats at DEBUG level when no compression needed
         if logger:
             logger.debug(
@@ -529,7 +526,7 @@ async def compress_context_if_needed(
         )
 
     # Safety check: if compressed result is still above threshold, force truncation to avoid loop
-    if should_compress_context(compressed_messages, model, state.compression_threshold):
+    if tokens_after / max_tokens >= state.compression_threshold:
         if logger:
             logger.warning(
                 f"⚠️ Post-compression context still above threshold "
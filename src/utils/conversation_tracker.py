@@ -4,6 +4,7 @@ Stores in .daveagent/conversations.json with newest first
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,8 @@ class ConversationTracker:
         """
         self.data_dir = Path(data_dir)
         self.conversations_file = self.data_dir / "conversations.json"
+        # Writers run in worker threads; serialize the load-modify-save cycle
+        self._lock = threading.Lock()
 
         # Create directory if it doesn't exist
         self.data_dir.mkdir(exist_ok=True)
@@ -66,9 +69,6 @@ class ConversationTracker:
         Returns:
             Conversation ID
         """
-        # Load existing conversations
-        conversations = self._load_conversations()
-
         # Create conversation record
         conversation_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         conversation = {
@@ -84,11 +84,13 @@ class ConversationTracker:
             "metadata": metadata or {},
         }
 
-        # Add to beginning (newest first)
-        conversations.insert(0, conversation)
+        with self._lock:
+            # Load existing conversations and add to beginning (newest first)
+            conversations = self._load_conversations()
+            conversations.insert(0, conversation)
 
-        # Save back to file
-        self._save_conversations(conversations)
+            # Save back to file
+            self._save_conversations(conversations)
 
         return conversation_id
 
@@ -187,17 +189,19 @@ class ConversationTracker:
         """
         from datetime import timedelta
 
-        conversations = self._load_conversations()
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        # Filter conversations
-        filtered = [
-            conv
-            for conv in conversations
-            if datetime.fromisoformat(conv.get("timestamp", "")) > cutoff_date
-        ]
+        with self._lock:
+            conversations = self._load_conversations()
+
+            # Filter conversations
+            filtered = [
+                conv
+                for conv in conversations
+                if datetime.fromisoformat(conv.get("timestamp", "")) > cutoff_date
+            ]
 
-        self._save_conversations(filtered)
+            self._save_conversations(filtered)
 
         return len(conversations) - len(filtered)  # Number removed
 
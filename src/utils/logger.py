@@ -4,8 +4,11 @@ Provides detailed logging with levels and colors
 Logs are saved in .daveagent/logs/
 """
 
+import atexit
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
@@ -59,6 +62,7 @@ class DaveAgentLogger:
         self.logger.addHandler(console_handler)
 
         # File handler (if specified or use default)
+        self.file_handler: logging.FileHandler | None = None
         if log_file is None:
             # Default: .daveagent/logs/daveagent_YYYYMMDD_HHMMSS.log
             log_dir = Path(".daveagent") / "logs"
@@ -76,7 +80,15 @@ class DaveAgentLogger:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            self.file_handler = file_handler
+
+            # The file receives every DEBUG record, so write it from a listener
+            # thread instead of blocking the event loop on disk I/O
+            log_queue = queue.SimpleQueue()
+            self._file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            self._file_listener.start()
+            atexit.register(self._file_listener.stop)
+            self.logger.addHandler(QueueHandler(log_queue))
 
     def debug(self, message: str, **kwargs):
         """Log debug message"""
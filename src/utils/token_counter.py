@@ -5,10 +5,26 @@ them to LLM APIs. This enables proactive context management and compression
 to prevent token limit errors.
 """
 
+import logging
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Any
 
-import tiktoken
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when no tiktoken encoding is available
+CHARS_PER_TOKEN = 4
+
+# Token counts of recent texts, keyed by (hash, length, model) so the cache
+# never keeps the texts themselves (tool outputs and files can be huge).
+# Enough entries for the role and content of a full 100-message window.
+_TOKEN_COUNT_CACHE_SIZE = 256
+_token_count_cache: OrderedDict[tuple[int, int, str], int] = OrderedDict()
 
 
 @lru_cache(maxsize=10)
@@ -19,11 +35,15 @@ def get_encoder(model: str):
         model: Model name (e.g., "deepseek-chat", "gpt-4")
 
     Returns:
-        tiktoken.Encoding instance for the model
+        tiktoken.Encoding instance for the model, or None if tiktoken is not
+        installed or the encoding cannot be loaded (it is downloaded on first use)
 
     Note:
         Results are cached to avoid repeatedly loading encoders.
     """
+    if tiktoken is None:
+        return None
+
     # Map model names to tiktoken encodings
     encoding_map = {
         "deepseek-chat": "cl100k_base",
@@ -36,7 +56,44 @@ def get_encoder(model: str):
     }
 
     encoding_name = encoding_map.get(model, "cl100k_base")
-    return tiktoken.get_encoding(encoding_name)
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(
+            f"Could not load tiktoken encoding '{encoding_name}' ({e}); "
+            f"estimating tokens as characters/{CHARS_PER_TOKEN}"
+        )
+        return None
+
+
+def count_text_tokens(text: str, model: str) -> int:
+    """Count tokens in a single string (cached).
+
+    Args:
+        text: Text to encode
+        model: Model name for encoding selection
+
+    Returns:
+        Number of tokens in text
+
+    Note:
+        The whole history is recounted before every LLM call, but only the
+        newest messages differ between calls. Counts are cached by text hash,
+        so only those get encoded. Without an encoder, falls back to characters/4.
+    """
+    key = (hash(text), len(text), model)
+    count = _token_count_cache.get(key)
+    if count is not None:
+        _token_count_cache.move_to_end(key)
+        return count
+
+    encoder = get_encoder(model)
+    count = -(-len(text) // CHARS_PER_TOKEN) if encoder is None else len(encoder.encode(text))
+
+    _token_count_cache[key] = count
+    if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+        _token_count_cache.popitem(last=False)
+    return count
 
 
 def count_message_tokens(messages: list[dict[str, Any]], model: str) -> int:
@@ -65,7 +122,6 @@ def count_message_tokens(messages: list[dict[str, Any]], model: str) -> int:
         >>> count_message_tokens(messages, "deepseek-chat")
         15
     """
-    encoder = get_encoder(model)
     total_tokens = 0
 
     for message in messages:
@@ -74,24 +130,24 @@ def count_message_tokens(messages: list[dict[str, Any]], model: str) -> int:
 
         # Count role tokens
         if "role" in message:
-            total_tokens += len(encoder.encode(message["role"]))
+            total_tokens += count_text_tokens(message["role"], model)
 
         # Count content tokens
         if "content" in message:
             content = message["content"]
             if isinstance(content, str):
-                total_tokens += len(encoder.encode(content))
+                total_tokens += count_text_tokens(content, model)
             elif isinstance(content, list):
                 # Handle multi-modal content (text + images)
                 for item in content:
                     if isinstance(item, dict) and "text" in item:
-                        total_tokens += len(encoder.encode(item["text"]))
+                        total_tokens += count_text_tokens(item["text"], model)
                     # Note: Image tokens are not counted here (model-specific)
 
         # Count function call tokens (tool calls)
         if "tool_calls" in message:
             for tool_call in message["tool_calls"]:
-                total_tokens += len(encoder.encode(str(tool_call)))
+                total_tokens += count_text_tokens(str(tool_call), model)
 
     total_tokens += 2  # Add for response priming
     return total_tokens
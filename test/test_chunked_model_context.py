@@ -0,0 +1,133 @@
+"""
+Tests for ChunkedChatCompletionContext - prefix-stable history window
+"""
+
+from autogen_core.models import (
+    AssistantMessage,
+    FunctionExecutionResult,
+    FunctionExecutionResultMessage,
+    UserMessage,
+)
+
+from src.utils.chunked_model_context import ChunkedChatCompletionContext
+
+
+def _user(i):
+    return UserMessage(content=f"message {i}", source="user")
+
+
+async def test_window_is_append_only_until_buffer_overflows():
+    """Each call extends the previous view until the buffer is exceeded"""
+    context = ChunkedChatCompletionContext(buffer_size=10)
+
+    previous = []
+    for i in range(10):
+        await context.add_message(_user(i))
+        messages = await context.get_messages()
+        assert messages[: len(previous)] == previous
+        previous = messages
+
+    assert len(previous) == 10
+
+
+async def test_window_resets_to_half_buffer():
+    """Overflowing the buffer keeps the newest half, then grows again"""
+    context = ChunkedChatCompletionContext(buffer_size=10)
+    for i in range(11):
+        await context.add_message(_user(i))
+
+    messages = await context.get_messages()
+    assert [m.content for m in messages] == [f"message {i}" for i in range(6, 11)]
+
+    await context.add_message(_user(11))
+    grown = await context.get_messages()
+    assert grown[:5] == messages
+    assert len(grown) == 6
+
+
+async def test_window_skips_leading_tool_result():
+    """A tool result cut off from its call is not sent"""
+    context = ChunkedChatCompletionContext(buffer_size=4)
+    await context.add_message(_user(0))
+    await context.add_message(_user(1))
+    await context.add_message(_user(2))
+    await context.add_message(AssistantMessage(content="calling", source="Coder"))
+    await context.add_message(
+        FunctionExecutionResultMessage(
+            content=[FunctionExecutionResult(content="ok", call_id="1", name="read_file")]
+        )
+    )
+
+    await context.add_message(_user(5))
+
+    # 6 > 4 messages: the window restarts at the last 2, which begin with the tool result
+    messages = await context.get_messages()
+    assert [m.content for m in messages] == ["message 5"]
+
+
+async def test_clear_and_load_state_reset_window():
+    context = ChunkedChatCompletionContext(buffer_size=4)
+    for i in range(5):
+        await context.add_message(_user(i))
+    await context.get_messages()
+    state = await context.save_state()
+
+    await context.clear()
+    await context.add_message(_user(99))
+    assert [m.content for m in await context.get_messages()] == ["message 99"]
+
+    await context.load_state(state)
+    assert [m.content for m in await context.get_messages()] == ["message 3", "message 4"]
+
+
+async def test_mark_leaves_window_after_reset():
+    """A mark stops matching once a reset drops it, or the messages are replaced"""
+    context = ChunkedChatCompletionContext(buffer_size=4)
+    await context.add_message(_user(0))
+    mark = context.mark()
+    await context.add_message(_user(1))
+    assert context.in_window(mark)
+
+    for i in range(2, 5):
+        await context.add_message(_user(i))
+    # 5 > 4 messages: the pending reset keeps only messages 3 and 4
+    assert not context.in_window(mark)
+
+    recent = context.mark()
+    await context.add_message(_user(5))
+    assert context.in_window(recent)
+    await context.clear()
+    assert not context.in_window(recent)
+
+
+async def test_mentioned_files_resent_after_window_reset():
+    """Unchanged files are referenced while in context and resent once dropped"""
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.main import DaveAgentCLI
+
+    coder_context = ChunkedChatCompletionContext(buffer_size=4)
+    planner_context = ChunkedChatCompletionContext(buffer_size=4)
+    app = SimpleNamespace(
+        cli=SimpleNamespace(
+            mentioned_files=["a.py"], get_mentioned_files_content=lambda: "FILE: a.py\nx = 1"
+        ),
+        coder_agent=SimpleNamespace(_model_context=coder_context),
+        planning_agent=SimpleNamespace(_model_context=planner_context),
+        logger=MagicMock(),
+        _mentioned_files_sent=None,
+    )
+
+    def files_context():
+        return DaveAgentCLI._get_mentioned_files_context(app)
+
+    assert files_context() == "FILE: a.py\nx = 1"
+    for context in (coder_context, planner_context):
+        await context.add_message(_user(0))
+    assert "content sent earlier" in files_context()
+
+    # Only the Planner's window drops the request that carried the files
+    for i in range(1, 5):
+        await planner_context.add_message(_user(i))
+    assert files_context() == "FILE: a.py\nx = 1"
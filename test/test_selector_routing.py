@@ -0,0 +1,61 @@
+"""
+Tests for the router's selector_func - which agent answers a user message
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from autogen_agentchat.messages import TextMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from src.config.orchestrator import AgentOrchestrator
+
+
+def _selector():
+    """Build the router team on a minimal orchestrator and return its selector"""
+    client = ReplayChatCompletionClient(
+        [],
+        model_info={
+            "vision": False,
+            "function_calling": True,
+            "json_output": False,
+            "family": "unknown",
+            "structured_output": False,
+        },
+    )
+    orchestrator = SimpleNamespace(
+        current_mode="agent",
+        all_tools={"read_only": [], "modification": []},
+        context_manager=SimpleNamespace(get_combined_context=lambda: ""),
+        client_strong=client,
+        client_base=client,
+        router_client=client,
+        json_logger=None,
+        logger=MagicMock(),
+        agent_id="test",
+    )
+    AgentOrchestrator._initialize_agents_for_mode(orchestrator)
+    return orchestrator.main_team._selector_func
+
+
+def _route(selector, text):
+    return selector([TextMessage(content=text, source="user")])
+
+
+def test_plain_english_request_goes_to_planner():
+    """Leading verbs in ordinary sentences do not skip the Planner"""
+    selector = _selector()
+    for text in (
+        "show me how the authentication works",
+        "list the steps to deploy this service",
+        "find all usages of the old config loader and remove them",
+        "read the docs and summarize the API",
+    ):
+        assert _route(selector, text) == "Planner", text
+
+
+def test_command_like_request_goes_to_coder():
+    """Shell-style commands and verbs on a path go straight to the Coder"""
+    selector = _selector()
+    for text in ("git status", "ls -la", "grep -rn TODO src", "read src/main.py", "show README.md"):
+        assert _route(selector, text) == "Coder", text